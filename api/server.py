@@ -175,6 +175,7 @@ def update_settings(payload: dict[str, Any]):
         "voice_noise_gate_enabled",
         "voice_noise_gate_threshold",
         "voice_noise_gate_attenuation",
+        "voice_whisper_compute_type",
         # Legacy voice settings (kept for backwards compatibility)
         "voice_pause_threshold_ms",
         "voice_live_transcribe_interval_ms",
@@ -578,6 +579,7 @@ def start_voice():
     noise_gate_enabled = bool(settings.get("voice_noise_gate_enabled", True))
     noise_gate_threshold = float(settings.get("voice_noise_gate_threshold", 0.01))
     noise_gate_attenuation = float(settings.get("voice_noise_gate_attenuation", 0.2))
+    whisper_compute_type = settings.get("voice_whisper_compute_type") or None
     # Legacy settings (only used if explicitly enabled)
     use_legacy_pause = bool(settings.get("voice_use_legacy_pause_threshold", False))
     audio_level_threshold = float(settings.get("voice_audio_level_threshold", silence_threshold))
@@ -629,6 +631,7 @@ def start_voice():
         noise_gate_enabled=noise_gate_enabled,
         noise_gate_threshold=noise_gate_threshold,
         noise_gate_attenuation=noise_gate_attenuation,
+        whisper_compute_type=whisper_compute_type,
         # Legacy parameters (VoiceListener maps these internally)
         pause_threshold_secs=pause_threshold_secs,
         min_command_seconds=min_command_seconds,
@@ -1,5 +1,5 @@
 """Minimal faster-whisper transcription package."""
 
-from fw_transcribe.core import TranscriptionResult, transcribe_file
+from fw_transcribe.core import TranscriptionResult, get_model, transcribe_file
 
-__all__ = ["TranscriptionResult", "transcribe_file"]
+__all__ = ["TranscriptionResult", "get_model", "transcribe_file"]
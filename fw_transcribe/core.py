@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Tuple
+from typing import BinaryIO, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 
 from faster_whisper import BatchedInferencePipeline, WhisperModel
 
@@ -30,9 +33,39 @@ class TranscriptionResult:
     segments: Tuple[Segment, ...]
 
 
-def _build_model(model_size: str, device: str, compute_type: str) -> WhisperModel:
-    """Create a WhisperModel with the requested device and compute type."""
-    return WhisperModel(model_size, device=device, compute_type=compute_type)
+_models: dict[Tuple[str, str, str, Optional[str], int], WhisperModel] = {}
+_models_lock = threading.Lock()
+
+
+def get_model(
+    model_size: str,
+    device: str,
+    compute_type: str,
+    download_root: Optional[str] = None,
+    cpu_threads: int = 0,
+) -> WhisperModel:
+    """Return a shared WhisperModel for the requested size, device and compute type.
+
+    Loading weights takes hundreds of milliseconds, so each configuration is
+    built once per process and reused by every later transcription.
+    ``download_root`` pins downloaded/converted models to a persistent
+    directory instead of the Hugging Face cache. ``cpu_threads`` sets the
+    CTranslate2 intra-op thread count; 0 keeps its default.
+    """
+    key = (model_size, device, compute_type, download_root, cpu_threads)
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            logger.debug("Loading WhisperModel %s on %s (%s)", *key[:3])
+            model = WhisperModel(
+                model_size,
+                device=device,
+                compute_type=compute_type,
+                download_root=download_root,
+                cpu_threads=cpu_threads,
+            )
+            _models[key] = model
+    return model
 
 
 def _iterate_segments(segments_iter: Iterable) -> List[Segment]:
@@ -43,8 +76,11 @@ def _iterate_segments(segments_iter: Iterable) -> List[Segment]:
     return segments
 
 
+AudioInput = Union[str, BinaryIO, np.ndarray]
+
+
 def transcribe_file(
-    audio_path: str,
+    audio_path: AudioInput,
     *,
     model_size: str = "large-v3",
     device: str = "cpu",
@@ -52,18 +88,23 @@ def transcribe_file(
     beam_size: int = 5,
     batch_size: int = 0,
     language: Optional[str] = None,
+    download_root: Optional[str] = None,
+    cpu_threads: int = 0,
 ) -> TranscriptionResult:
     """Transcribe an audio file to text using faster-whisper.
 
     Args:
-        audio_path: Path to the audio file.
+        audio_path: Path to the audio file, an open binary file object (e.g.
+            ``io.BytesIO`` holding WAV bytes), or a 16 kHz float32 waveform.
         model_size: Whisper model name or local path.
         device: "cpu", "cuda", or "auto".
         compute_type: "int8", "float16", "int8_float16", etc.
         beam_size: Beam search size for decoding.
         batch_size: If > 0, uses BatchedInferencePipeline.
+        download_root: Directory for downloaded models (default: HF cache).
+        cpu_threads: CTranslate2 CPU threads (0 keeps its default).
     """
-    model = _build_model(model_size, device, compute_type)
+    model = get_model(model_size, device, compute_type, download_root, cpu_threads)
 
     if batch_size and batch_size > 0:
         logger.debug("Using BatchedInferencePipeline with batch_size=%s", batch_size)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import math
 import threading
 import time
-from collections import Counter, deque
+from collections import deque
 from typing import Optional
+
 import numpy as np
+
 from command_controller.controller import CommandController
 from utils.file_utils import load_json
 from utils.log_utils import tprint
@@ -18,11 +21,13 @@ from video_module.tflite_pipeline import (
     PointHistoryBuffer,
     calc_landmark_list,
     pre_process_landmark,
-    pre_process_point_history,
 )
 
 
 CAMERA_FACING_GESTURES = {"Open", "Close", "Pointer", "OK"}
+# Squared L2 distance between normalized keypoint vectors below which the
+# previous classification is reused (hand held still).
+KEYPOINT_REUSE_EPS = 1e-4
 
 
 def calc_hand_facing_direction(hand_landmarks, handedness) -> str:
@@ -30,30 +35,75 @@ def calc_hand_facing_direction(hand_landmarks, handedness) -> str:
     index_mcp = hand_landmarks.landmark[5]
     pinky_mcp = hand_landmarks.landmark[17]
 
-    v1 = np.array(
-        [index_mcp.x - wrist.x, index_mcp.y - wrist.y, index_mcp.z - wrist.z]
-    )
-    v2 = np.array(
-        [pinky_mcp.x - wrist.x, pinky_mcp.y - wrist.y, pinky_mcp.z - wrist.z]
-    )
-    normal = np.cross(v1, v2)
+    # Palm normal = (index_mcp - wrist) x (pinky_mcp - wrist), done on scalars:
+    # for 3-vectors NumPy's per-call dispatch costs more than the math itself.
+    ax, ay, az = index_mcp.x - wrist.x, index_mcp.y - wrist.y, index_mcp.z - wrist.z
+    bx, by, bz = pinky_mcp.x - wrist.x, pinky_mcp.y - wrist.y, pinky_mcp.z - wrist.z
+    nx = ay * bz - az * by
+    ny = az * bx - ax * bz
+    nz = ax * by - ay * bx
 
     if handedness and handedness.classification:
         if handedness.classification[0].label == "Left":
-            normal = -normal
+            nx, ny, nz = -nx, -ny, -nz
 
-    norm = np.linalg.norm(normal)
-    if norm < 1e-6:
+    if math.hypot(nx, ny, nz) < 1e-6:
         return "Unknown"
 
-    normal = normal / norm
-    axis = int(np.argmax(np.abs(normal)))
-
-    if axis == 2:
-        return "Away" if normal[2] < 0 else "Camera"
-    if axis == 0:
-        return "Right" if normal[0] > 0 else "Left"
-    return "Down" if normal[1] > 0 else "Up"
+    # The dominant axis and its sign are unaffected by normalizing to unit length.
+    abs_x, abs_y, abs_z = abs(nx), abs(ny), abs(nz)
+    if abs_x >= abs_y and abs_x >= abs_z:
+        return "Right" if nx > 0 else "Left"
+    if abs_y >= abs_z:
+        return "Down" if ny > 0 else "Up"
+    return "Away" if nz < 0 else "Camera"
+
+
+class RollingMode:
+    """Majority vote over the last ``maxlen`` ids with O(1) updates per frame.
+
+    Ties resolve to the value seen earliest in the window, matching
+    ``Counter(window).most_common(1)``.
+    """
+
+    def __init__(self, maxlen: int, values=()) -> None:
+        self._window: deque = deque(maxlen=maxlen)
+        self._counts: dict = {}
+        for value in values:
+            self.append(value)
+
+    @property
+    def maxlen(self) -> int:
+        return self._window.maxlen
+
+    def append(self, value) -> None:
+        if len(self._window) == self._window.maxlen:
+            old = self._window[0]
+            remaining = self._counts[old] - 1
+            if remaining:
+                self._counts[old] = remaining
+            else:
+                del self._counts[old]
+        self._window.append(value)
+        self._counts[value] = self._counts.get(value, 0) + 1
+
+    def mode(self):
+        if not self._counts:
+            return None
+        best = max(self._counts.values())
+        leaders = [value for value, count in self._counts.items() if count == best]
+        if len(leaders) == 1:
+            return leaders[0]
+        for value in self._window:
+            if self._counts[value] == best:
+                return value
+        return leaders[0]
+
+    def __iter__(self):
+        return iter(self._window)
+
+    def __len__(self) -> int:
+        return len(self._window)
 
 
 class RealTimeGestureRecognizer:
@@ -95,11 +145,13 @@ class RealTimeGestureRecognizer:
             if "Pointer" in self._keypoint_labels
             else 2
         )
-        self._keypoint_history = deque(maxlen=stable_frames)
+        self._keypoint_history = RollingMode(stable_frames)
         self._point_history = PointHistoryBuffer(maxlen=POINT_HISTORY_LEN)
-        self._finger_gesture_history = deque(maxlen=POINT_HISTORY_LEN)
+        self._finger_gesture_history = RollingMode(POINT_HISTORY_LEN)
 
         self._keypoint_classifier = None
+        self._last_keypoint_features: np.ndarray | None = None
+        self._last_keypoint_result: tuple[int, float] = (-1, 0.0)
         if dataset.keypoint_model_path.exists():
             try:
                 self._keypoint_classifier = KeyPointClassifier(dataset.keypoint_model_path)
@@ -122,6 +174,8 @@ class RealTimeGestureRecognizer:
         detection_conf = float(cfg.get("detection_threshold", 0.6))
         tracking_conf = float(cfg.get("min_tracking_confidence", cfg.get("tracking_threshold", 0.6)))
         device_index = int(cfg.get("device_index", 0))
+        # 0 selects MediaPipe's lite hand landmark model, roughly twice as fast on CPU.
+        model_complexity = int(cfg.get("model_complexity", 1))
 
         try:
             import mediapipe as mp
@@ -141,19 +195,26 @@ class RealTimeGestureRecognizer:
                 "MediaPipe is missing 'solutions'. Install mediapipe>=0.10 in the active interpreter."
             )
 
-        from video_module.video_stream import VideoStream
+        from video_module.video_stream import FrameGrabber, VideoStream
 
         self._cv2 = cv2
-        self.stream = VideoStream(device_index=device_index)
+        self.stream = VideoStream(
+            device_index=device_index,
+            width=int(cfg["frame_width"]) if cfg.get("frame_width") else None,
+            height=int(cfg["frame_height"]) if cfg.get("frame_height") else None,
+        )
+        # Camera reads run on a worker so capture overlaps MediaPipe inference.
+        self._grabber = FrameGrabber(self.stream)
         self._hands = mp_solutions.hands.Hands(
             static_image_mode=False,
             max_num_hands=1,
             min_detection_confidence=detection_conf,
             min_tracking_confidence=tracking_conf,
-            model_complexity=1,
+            model_complexity=model_complexity,
         )
         self._drawer = mp_solutions.drawing_utils
         self._hand_connections = mp_solutions.hands.HAND_CONNECTIONS
+        self._rgb: np.ndarray | None = None
         self.active = False
         self._stop_event = threading.Event()
         self._closed = False
@@ -201,6 +262,7 @@ class RealTimeGestureRecognizer:
 
     def _run_loop(self) -> None:
         self.stream.open()
+        self._grabber.start()
         self.active = True
         self._last_frame_ts = time.monotonic()
         if is_deep_logging() and not self.enabled_labels:
@@ -214,16 +276,24 @@ class RealTimeGestureRecognizer:
                         tprint("[GESTURE] Watchdog triggered; stopping recognition.")
                         break
                 loop_start = time.monotonic()
-                ok, frame = self.stream.read()
+                # Only the watchdog bounds how long a frame may take; with it
+                # disabled, a stalled camera is waited on like a blocking read.
+                timeout = None
+                if self.watchdog_timeout_secs > 0:
+                    timeout = max(
+                        self.watchdog_timeout_secs - (loop_start - self._last_frame_ts), 0.0
+                    )
+                ok, frame = self._grabber.read(timeout=timeout)
                 if not ok or frame is None:
-                    tprint("[GESTURE] Failed to read from camera.")
+                    if self._grabber.is_alive():
+                        tprint("[GESTURE] Watchdog triggered; stopping recognition.")
+                    else:
+                        tprint("[GESTURE] Failed to read from camera.")
                     break
                 self._last_frame_ts = time.monotonic()
 
                 frame = self._cv2.flip(frame, 1)
-                results = self._hands.process(
-                    self._cv2.cvtColor(frame, self._cv2.COLOR_BGR2RGB)
-                )
+                results = self._process(frame)
 
                 label = "NONE"
                 confidence = 0.0
@@ -239,7 +309,7 @@ class RealTimeGestureRecognizer:
                     keypoint_id = -1
                     keypoint_score = 0.0
                     if self._keypoint_classifier:
-                        keypoint_id, keypoint_score = self._keypoint_classifier(
+                        keypoint_id, keypoint_score = self._classify_keypoints(
                             pre_processed_landmark_list
                         )
                     if keypoint_id == self._pointer_id:
@@ -247,9 +317,7 @@ class RealTimeGestureRecognizer:
                     else:
                         self._point_history.zeros()
 
-                    point_history_list = pre_process_point_history(
-                        frame, self._point_history.as_list()
-                    )
+                    point_history_list = self._point_history.normalized(frame)
                     finger_gesture_id = 0
                     finger_gesture_score = 0.0
                     if (
@@ -260,14 +328,10 @@ class RealTimeGestureRecognizer:
                             point_history_list
                         )
                     self._finger_gesture_history.append(finger_gesture_id)
-                    most_common_fg = Counter(self._finger_gesture_history).most_common(1)
-                    if most_common_fg:
-                        finger_gesture_id = most_common_fg[0][0]
+                    finger_gesture_id = self._finger_gesture_history.mode()
 
                     self._keypoint_history.append(keypoint_id)
-                    most_common_keypoint = Counter(self._keypoint_history).most_common(1)
-                    if most_common_keypoint:
-                        keypoint_id = most_common_keypoint[0][0]
+                    keypoint_id = self._keypoint_history.mode()
 
                     label, confidence = self._resolve_label(
                         keypoint_id=keypoint_id,
@@ -351,6 +415,28 @@ class RealTimeGestureRecognizer:
         finally:
             self._cleanup(join_thread=False)
 
+    def _process(self, frame):
+        """Run MediaPipe Hands on a BGR frame via a reused RGB buffer."""
+        if self._rgb is None or self._rgb.shape != frame.shape:
+            self._rgb = np.empty_like(frame)
+        self._rgb.flags.writeable = True
+        self._cv2.cvtColor(frame, self._cv2.COLOR_BGR2RGB, dst=self._rgb)
+        # A read-only image lets MediaPipe skip its defensive copy.
+        self._rgb.flags.writeable = False
+        return self._hands.process(self._rgb)
+
+    def _classify_keypoints(self, features: np.ndarray) -> tuple[int, float]:
+        last = self._last_keypoint_features
+        if last is not None and last.shape == features.shape:
+            diff = features - last
+            if float(np.dot(diff, diff)) < KEYPOINT_REUSE_EPS:
+                return self._last_keypoint_result
+        # Compare against the last *inferred* vector so slow drift still re-runs.
+        result = self._keypoint_classifier(features)
+        self._last_keypoint_features = features
+        self._last_keypoint_result = result
+        return result
+
     def _sleep_for_fps(self, loop_start: float) -> None:
         if not self.max_fps or self.max_fps <= 0:
             return
@@ -391,6 +477,7 @@ class RealTimeGestureRecognizer:
         if self._closed:
             return
         self.active = False
+        self._grabber.stop()
         self.stream.close()
         if self._hands:
             try:
@@ -429,8 +516,7 @@ class RealTimeGestureRecognizer:
         if confidence_threshold is not None:
             self.confidence_threshold = float(confidence_threshold)
         if stable_frames is not None and stable_frames > 0:
-            history = list(self._keypoint_history)
-            self._keypoint_history = deque(history, maxlen=int(stable_frames))
+            self._keypoint_history = RollingMode(int(stable_frames), self._keypoint_history)
         if emit_cooldown_secs is not None:
             self.emit_cooldown_secs = float(emit_cooldown_secs)
         if emit_actions is not None:
@@ -6,6 +6,7 @@ This keeps the camera closed until explicitly invoked by the UI/consumer.
 from __future__ import annotations
 
 from command_controller.controller import CommandController
+from utils.file_utils import load_json
 from utils.log_utils import tprint
 from video_module.gesture_ml import GestureCollector, GestureDataset
 from pathlib import Path
@@ -18,8 +19,14 @@ if TYPE_CHECKING:
 class GestureWorkflow:
     """Wraps dataset, training, and realtime recognition for a user."""
 
-    def __init__(self, user_id: str = "default", window_size: int = 30) -> None:
+    def __init__(
+        self,
+        user_id: str = "default",
+        window_size: int = 30,
+        config_path: str = "config/gesture_config.json",
+    ) -> None:
         self.user_id = user_id
+        self.config_path = config_path
         self.window_size = window_size
         self.dataset = GestureDataset(user_id=user_id)
         self._recognizer: "RealTimeGestureRecognizer" | None = None
@@ -30,8 +37,17 @@ class GestureWorkflow:
         """Ensure preset keypoint CSV/labels exist under user_data."""
         return self.dataset.ensure_presets()
 
+    def _new_collector(self, show_preview: bool) -> GestureCollector:
+        # Collect with the hand model the recognizer runs, so training
+        # landmarks come from the same model as those seen at inference.
+        cfg = load_json(self.config_path)
+        return GestureCollector(
+            model_complexity=int(cfg.get("model_complexity", 1)),
+            show_preview=show_preview,
+        )
+
     def collect_static(self, label: str, target_frames: int = 60, *, show_preview: bool = False) -> None:
-        collector = GestureCollector(show_preview=show_preview)
+        collector = self._new_collector(show_preview)
         collector.collect_static(self.dataset, label, target_frames=target_frames)
 
     def collect_dynamic(
@@ -42,7 +58,7 @@ class GestureWorkflow:
         sequence_length: int = 30,
         show_preview: bool = False,
     ) -> None:
-        collector = GestureCollector(show_preview=show_preview)
+        collector = self._new_collector(show_preview)
         collector.collect_dynamic(
             self.dataset,
             label,
@@ -76,6 +92,7 @@ class GestureWorkflow:
         self._recognizer = RealTimeGestureRecognizer(
             controller,
             user_id=self.user_id,
+            config_path=self.config_path,
             confidence_threshold=confidence_threshold,
             stable_frames=stable_frames,
             show_window=show_window,
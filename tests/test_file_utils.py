@@ -0,0 +1,36 @@
+"""Tests for the JSON load/save helpers."""
+
+import json
+
+import pytest
+
+from utils import file_utils
+from utils.file_utils import load_json, save_json
+
+
+class TestSaveJson:
+    """Test suite for save_json."""
+
+    def test_round_trips_and_creates_parents(self, tmp_path):
+        """Test that saved data loads back and missing directories are created."""
+        path = tmp_path / "nested" / "data.json"
+
+        save_json(path, {"a": [1, 2]})
+
+        assert load_json(path) == {"a": [1, 2]}
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_failed_write_keeps_previous_file(self, tmp_path, monkeypatch):
+        """Test that an interrupted save leaves the old contents and no temp file."""
+        path = tmp_path / "data.json"
+        save_json(path, {"old": True})
+
+        def _boom(_src, _dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(file_utils.os, "replace", _boom)
+        with pytest.raises(OSError):
+            save_json(path, {"new": True})
+
+        assert json.loads(path.read_text()) == {"old": True}
+        assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,271 @@
+"""Tests for GestureDataset CSV and metadata persistence."""
+
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from video_module import gesture_ml
+from video_module.gesture_ml import GestureDataset, _StatusOverlay
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    return GestureDataset(user_id="tester", base_dir=tmp_path)
+
+
+def _rows(path):
+    with path.open(encoding="utf-8") as fh:
+        return [row for row in csv.reader(fh) if row]
+
+
+class TestGestureDatasetSamples:
+    """Test suite for sample and label persistence."""
+
+    def test_append_keypoint_sample_registers_label(self, dataset):
+        """Test that appending a sample adds the label and writes the row."""
+        dataset.append_keypoint_sample("Open", [0.0, 0.5, -0.25])
+        dataset.flush_samples()
+
+        assert dataset.keypoint_labels() == ["Open"]
+        assert _rows(dataset.keypoint_csv) == [["0", "0", "0.5", "-0.25"]]
+
+    def test_feature_rows_are_compact(self, dataset):
+        """Test that features are written with six significant digits."""
+        dataset.append_point_history_sample("Swipe", [1 / 3, 2 / 3])
+        dataset.flush_samples()
+
+        assert _rows(dataset.point_history_csv) == [["0", "0.333333", "0.666667"]]
+
+    def test_labels_are_indexed_in_insertion_order(self, dataset):
+        """Test that new labels get increasing ids."""
+        dataset.append_keypoint_sample("Open", [0.0])
+        dataset.append_keypoint_sample("Close", [1.0])
+        dataset.append_keypoint_sample("Open", [0.5])
+        dataset.flush_samples()
+
+        assert dataset.keypoint_labels() == ["Open", "Close"]
+        assert [row[0] for row in _rows(dataset.keypoint_csv)] == ["0", "1", "0"]
+
+    def test_remove_label_reindexes_rows(self, dataset):
+        """Test that removing a label drops its rows and shifts later ids."""
+        dataset.append_keypoint_sample("Open", [0.0])
+        dataset.append_keypoint_sample("Close", [1.0])
+        dataset.append_keypoint_sample("Pointer", [2.0])
+        dataset.set_hotkey("Close", "ctrl+c")
+
+        dataset.remove_label("Close")
+
+        assert dataset.keypoint_labels() == ["Open", "Pointer"]
+        assert _rows(dataset.keypoint_csv) == [["0", "0"], ["1", "2"]]
+        assert "Close" not in dataset.hotkeys
+
+    def test_remove_label_skips_malformed_lines_and_keeps_features(self, dataset):
+        """Test that blank/non-numeric lines are dropped and features copied verbatim."""
+        dataset.append_keypoint_sample("Open", [0.0])
+        dataset.append_keypoint_sample("Close", [1.0])
+        dataset.flush_samples()
+        dataset.keypoint_csv.write_bytes(
+            b"0,0.5\r\n\r\nlabel,x\r\n1,0.25,-1e-05\r\n10,9"
+        )
+
+        dataset.remove_label("Open")
+
+        assert dataset.keypoint_csv.read_bytes() == b"0,0.25,-1e-05\r\n9,9\r\n"
+        assert list(dataset.keypoint_dir.glob(".*.tmp")) == []
+
+    def test_samples_are_staged_until_flush(self, dataset):
+        """Test that rows reach disk only when flushed, in append order."""
+        dataset.append_keypoint_sample("Open", [0.0])
+        dataset.append_keypoint_sample("Open", [1.0])
+
+        assert not dataset.keypoint_csv.exists()
+
+        dataset.flush_samples()
+        dataset.flush_samples()
+
+        assert _rows(dataset.keypoint_csv) == [["0", "0"], ["0", "1"]]
+
+
+class TestEnsurePresets:
+    """Test suite for copying bundled presets into a user dataset."""
+
+    def test_copies_missing_presets_and_keeps_existing(self, tmp_path, monkeypatch):
+        """Test that presets fill gaps without overwriting user files."""
+        presets = tmp_path / "data" / "presets"
+        presets.mkdir(parents=True)
+        (presets / "keypoint.csv").write_text("0,0.1\n")
+        (presets / "keypoint_classifier_label.csv").write_text("Open\nClose\n")
+        (presets / "keypoint_classifier.tflite").write_bytes(b"\x00model")
+        monkeypatch.chdir(tmp_path)
+        dataset = GestureDataset(user_id="tester", base_dir=tmp_path / "users")
+        dataset.keypoint_dir.mkdir(parents=True)
+        dataset.keypoint_csv.write_text("1,0.9\n")
+
+        assert dataset.ensure_presets()
+
+        assert dataset.keypoint_csv.read_text() == "1,0.9\n"
+        assert dataset.keypoint_labels() == ["Open", "Close"]
+        assert dataset.keypoint_model_path.read_bytes() == b"\x00model"
+        assert not dataset.point_history_labels_path.exists()
+        assert json.loads(dataset.enabled_path.read_text()) == ["Close", "Open"]
+
+
+class TestGestureDatasetAutoFlush:
+    """Test suite for threshold and exit-time sample flushing."""
+
+    def test_flushes_when_threshold_reached(self, dataset, monkeypatch):
+        """Test that staged rows are written once the threshold is hit."""
+        monkeypatch.setattr(gesture_ml, "SAMPLE_FLUSH_ROWS", 3)
+
+        for value in range(4):
+            dataset.append_keypoint_sample("Open", [float(value)])
+
+        assert [row[1] for row in _rows(dataset.keypoint_csv)] == ["0", "1", "2"]
+
+        dataset.flush_samples()
+        assert len(_rows(dataset.keypoint_csv)) == 4
+
+    def test_exit_hook_flushes_live_datasets(self, dataset):
+        """Test that pending rows are written by the atexit hook."""
+        dataset.append_keypoint_sample("Open", [0.5])
+
+        gesture_ml._flush_live_datasets()
+
+        assert _rows(dataset.keypoint_csv) == [["0", "0.5"]]
+
+
+class TestGestureDatasetLabels:
+    """Test suite for cached label CSV access."""
+
+    def test_repeated_appends_do_not_reparse_labels(self, dataset, monkeypatch):
+        """Test that the label CSV is parsed once while it is unchanged."""
+        dataset.append_keypoint_sample("Open", [0.0])
+        reads = []
+        original = gesture_ml._read_label_csv
+        monkeypatch.setattr(
+            gesture_ml, "_read_label_csv", lambda path: reads.append(path) or original(path)
+        )
+
+        for _ in range(5):
+            dataset.append_keypoint_sample("Open", [0.0])
+
+        assert reads == []
+
+    def test_sees_labels_written_by_another_instance(self, dataset, tmp_path):
+        """Test that external label edits invalidate the cache."""
+        assert dataset.keypoint_labels() == []
+
+        other = GestureDataset(user_id="tester", base_dir=tmp_path)
+        other.append_keypoint_sample("Open", [0.0])
+
+        assert dataset.keypoint_labels() == ["Open"]
+
+    def test_returned_labels_are_copies(self, dataset):
+        """Test that mutating the public list does not corrupt the cache."""
+        dataset.append_keypoint_sample("Open", [0.0])
+
+        dataset.keypoint_labels().append("Bogus")
+
+        assert dataset.keypoint_labels() == ["Open"]
+
+
+class TestGestureDatasetMetadata:
+    """Test suite for hotkey/command/enabled metadata."""
+
+    def test_metadata_round_trips_through_disk(self, dataset, tmp_path):
+        """Test that metadata written by one instance is loaded by another."""
+        dataset.set_hotkey("Open", "ctrl+o")
+        dataset.set_command("Open", "open notes")
+        dataset.set_command_steps("Open", [{"intent": "open_app", "app": "Notes"}])
+        dataset.set_command_metadata("Open", {"source": "test"})
+        dataset.set_enabled("Open", True)
+
+        reloaded = GestureDataset(user_id="tester", base_dir=tmp_path)
+
+        assert reloaded.hotkeys == {"Open": "ctrl+o"}
+        assert reloaded.commands == {"Open": "open notes"}
+        assert reloaded.command_steps == {"Open": [{"intent": "open_app", "app": "Notes"}]}
+        assert reloaded.get_command_metadata("Open") == {"source": "test"}
+        assert reloaded.is_enabled("Open")
+
+    def test_clearing_values_removes_entries(self, dataset):
+        """Test that falsy values remove metadata entries."""
+        dataset.set_hotkey("Open", "ctrl+o")
+        dataset.set_hotkey("Open", None)
+        dataset.set_enabled("Open", True)
+        dataset.set_enabled("Open", False)
+
+        assert dataset.hotkeys == {}
+        assert not dataset.is_enabled("Open")
+
+    def test_with_block_defers_writes_until_exit(self, dataset):
+        """Test that bulk updates inside ``with dataset:`` write once at exit."""
+        with dataset:
+            dataset.set_hotkey("Open", "ctrl+o")
+            dataset.set_hotkey("Close", "ctrl+w")
+            assert not dataset.hotkeys_path.exists()
+
+        assert json.loads(dataset.hotkeys_path.read_text()) == {
+            "Open": "ctrl+o",
+            "Close": "ctrl+w",
+        }
+
+    def test_remove_label_rewrites_only_changed_files(self, dataset):
+        """Test that untouched metadata files are not rewritten."""
+        dataset.set_hotkey("Open", "ctrl+o")
+        dataset.set_command("Close", "close window")
+
+        dataset.remove_label("Open")
+
+        assert json.loads(dataset.hotkeys_path.read_text()) == {}
+        assert json.loads(dataset.commands_path.read_text()) == {"Close": "close window"}
+        assert not dataset.command_steps_path.exists()
+        assert not dataset.enabled_path.exists()
+
+
+class _FakeCv2:
+    """Draws a solid block in place of glyphs and counts rasterizations."""
+
+    FONT_HERSHEY_SIMPLEX = 0
+
+    def __init__(self):
+        self.put_text_calls = 0
+
+    def getTextSize(self, text, font, scale, thickness):
+        return (len(text) * 4, 8), 2
+
+    def putText(self, img, text, org, font, scale, color, thickness):
+        self.put_text_calls += 1
+        x, y = org
+        img[y - 8 : y, x : x + len(text) * 4] = color
+
+
+class TestStatusOverlay:
+    """Test suite for the cached collector status overlay."""
+
+    def test_rasterizes_only_when_text_changes(self):
+        """Test that an unchanged status is blitted without re-rendering."""
+        cv2 = _FakeCv2()
+        overlay = _StatusOverlay(cv2)
+        frame = np.zeros((60, 120, 3), dtype=np.uint8)
+
+        overlay.draw(frame, "Open 1/5", (0, 255, 0))
+        overlay.draw(frame, "Open 1/5", (0, 255, 0))
+        assert cv2.put_text_calls == 1
+
+        overlay.draw(frame, "Open 2/5", (0, 255, 0))
+        assert cv2.put_text_calls == 2
+
+    def test_blit_matches_direct_draw_and_keeps_background(self):
+        """Test that only text pixels are written, clipped to the frame."""
+        cv2 = _FakeCv2()
+        overlay = _StatusOverlay(cv2)
+        frame = np.full((40, 30, 3), 7, dtype=np.uint8)
+        expected = frame.copy()
+        cv2.putText(expected, "Swipe", (10, 30), 0, 0.7, (255, 255, 0), 2)
+
+        overlay.draw(frame, "Swipe", (255, 255, 0))
+
+        np.testing.assert_array_equal(frame, expected)
@@ -0,0 +1,150 @@
+"""Tests for gesture recognizer helpers that do not need a camera."""
+
+from collections import Counter, deque
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from gesture_module.gesture_recognizer import (
+    RealTimeGestureRecognizer,
+    RollingMode,
+    calc_hand_facing_direction,
+)
+
+
+def _landmarks(points):
+    landmark = [SimpleNamespace(x=0.0, y=0.0, z=0.0) for _ in range(21)]
+    for index, (x, y, z) in points.items():
+        landmark[index] = SimpleNamespace(x=x, y=y, z=z)
+    return SimpleNamespace(landmark=landmark)
+
+
+def _handedness(label):
+    return SimpleNamespace(classification=[SimpleNamespace(label=label)])
+
+
+def _reference_direction(hand_landmarks, handedness):
+    wrist = hand_landmarks.landmark[0]
+    index_mcp = hand_landmarks.landmark[5]
+    pinky_mcp = hand_landmarks.landmark[17]
+    v1 = np.array([index_mcp.x - wrist.x, index_mcp.y - wrist.y, index_mcp.z - wrist.z])
+    v2 = np.array([pinky_mcp.x - wrist.x, pinky_mcp.y - wrist.y, pinky_mcp.z - wrist.z])
+    normal = np.cross(v1, v2)
+    if handedness and handedness.classification[0].label == "Left":
+        normal = -normal
+    norm = np.linalg.norm(normal)
+    if norm < 1e-6:
+        return "Unknown"
+    normal = normal / norm
+    axis = int(np.argmax(np.abs(normal)))
+    if axis == 2:
+        return "Away" if normal[2] < 0 else "Camera"
+    if axis == 0:
+        return "Right" if normal[0] > 0 else "Left"
+    return "Down" if normal[1] > 0 else "Up"
+
+
+class TestCalcHandFacingDirection:
+    """Test suite for calc_hand_facing_direction."""
+
+    def test_palm_towards_camera(self):
+        """Test that a palm normal along +z reports Camera."""
+        hand = _landmarks({0: (0.5, 0.5, 0.0), 5: (0.6, 0.5, 0.0), 17: (0.5, 0.6, 0.0)})
+        assert calc_hand_facing_direction(hand, _handedness("Right")) == "Camera"
+
+    def test_left_hand_flips_normal(self):
+        """Test that a left hand mirrors the palm normal."""
+        hand = _landmarks({0: (0.5, 0.5, 0.0), 5: (0.6, 0.5, 0.0), 17: (0.5, 0.6, 0.0)})
+        assert calc_hand_facing_direction(hand, _handedness("Left")) == "Away"
+
+    def test_degenerate_hand_is_unknown(self):
+        """Test that collinear landmarks do not produce a direction."""
+        hand = _landmarks({0: (0.5, 0.5, 0.0), 5: (0.6, 0.5, 0.0), 17: (0.7, 0.5, 0.0)})
+        assert calc_hand_facing_direction(hand, None) == "Unknown"
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_numpy_reference(self, seed):
+        """Test that the scalar math agrees with the NumPy cross/norm version."""
+        rng = np.random.default_rng(seed)
+        for _ in range(200):
+            points = {i: tuple(rng.uniform(-1, 1, size=3)) for i in (0, 5, 17)}
+            hand = _landmarks(points)
+            handedness = _handedness("Left" if rng.random() < 0.5 else "Right")
+            assert calc_hand_facing_direction(hand, handedness) == _reference_direction(
+                hand, handedness
+            )
+
+
+class _CountingClassifier:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, features):
+        self.calls += 1
+        return self.calls, 0.9
+
+
+def _bare_recognizer(classifier):
+    recognizer = RealTimeGestureRecognizer.__new__(RealTimeGestureRecognizer)
+    recognizer._keypoint_classifier = classifier
+    recognizer._last_keypoint_features = None
+    recognizer._last_keypoint_result = (-1, 0.0)
+    return recognizer
+
+
+class TestClassifyKeypoints:
+    """Test suite for the still-hand inference gate."""
+
+    def test_nearly_identical_features_reuse_result(self):
+        """Test that a still hand does not re-run the classifier."""
+        classifier = _CountingClassifier()
+        recognizer = _bare_recognizer(classifier)
+        features = np.linspace(-1, 1, 42, dtype=np.float32)
+
+        first = recognizer._classify_keypoints(features)
+        second = recognizer._classify_keypoints(features + 1e-4)
+
+        assert first == second == (1, 0.9)
+        assert classifier.calls == 1
+
+    def test_moved_hand_reruns_classifier(self):
+        """Test that a real pose change is classified again."""
+        classifier = _CountingClassifier()
+        recognizer = _bare_recognizer(classifier)
+        features = np.zeros(42, dtype=np.float32)
+
+        recognizer._classify_keypoints(features)
+        moved = features.copy()
+        moved[0] = 0.5
+
+        assert recognizer._classify_keypoints(moved) == (2, 0.9)
+        assert classifier.calls == 2
+
+
+class TestRollingMode:
+    """Test suite for the incremental majority vote."""
+
+    def test_matches_counter_most_common(self):
+        """Test that every step agrees with Counter over the same window."""
+        rng = np.random.default_rng(1)
+        window = deque(maxlen=5)
+        rolling = RollingMode(5)
+
+        for value in rng.integers(0, 4, size=300).tolist():
+            window.append(value)
+            rolling.append(value)
+            assert rolling.mode() == Counter(window).most_common(1)[0][0]
+
+    def test_resize_keeps_newest_values(self):
+        """Test that rebuilding with a smaller window keeps the latest ids."""
+        rolling = RollingMode(4, [1, 1, 2, 2])
+
+        resized = RollingMode(2, rolling)
+
+        assert list(resized) == [2, 2]
+        assert resized.mode() == 2
+
+    def test_empty_window_has_no_mode(self):
+        """Test that an empty window reports None."""
+        assert RollingMode(3).mode() is None
@@ -0,0 +1,61 @@
+"""Tests for GestureWorkflow collection wiring (camera and dataset are faked)."""
+
+import json
+
+import pytest
+
+from gesture_module import workflow
+from gesture_module.workflow import GestureWorkflow
+
+
+class _FakeDataset:
+    def __init__(self, user_id):
+        self.enabled = []
+
+    def ensure_presets(self):
+        return True
+
+
+class _FakeCollector:
+    """Records constructor kwargs instead of opening a camera."""
+
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        type(self).instances.append(self)
+
+    def collect_static(self, dataset, label, target_frames=60):
+        return 0
+
+    def collect_dynamic(self, dataset, label, *, repetitions=5, show_preview=None):
+        return 0
+
+
+@pytest.fixture
+def fake_workflow(monkeypatch, tmp_path):
+    monkeypatch.setattr(workflow, "GestureDataset", _FakeDataset)
+    monkeypatch.setattr(workflow, "GestureCollector", _FakeCollector)
+    _FakeCollector.instances = []
+    config_path = tmp_path / "gesture_config.json"
+    config_path.write_text(json.dumps({"model_complexity": 0}))
+    return GestureWorkflow(config_path=str(config_path))
+
+
+class TestCollection:
+    """Test suite for collector construction."""
+
+    def test_collectors_use_configured_model_complexity(self, fake_workflow):
+        """Test that training data comes from the same hand model as recognition."""
+        fake_workflow.collect_static("open")
+        fake_workflow.collect_dynamic("swipe", repetitions=1)
+
+        assert [c.kwargs["model_complexity"] for c in _FakeCollector.instances] == [0, 0]
+
+    def test_missing_config_keeps_default_model(self, fake_workflow, tmp_path):
+        """Test that the full hand model is used when the config is absent."""
+        fake_workflow.config_path = str(tmp_path / "missing.json")
+
+        fake_workflow.collect_static("open")
+
+        assert _FakeCollector.instances[0].kwargs["model_complexity"] == 1
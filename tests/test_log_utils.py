@@ -0,0 +1,100 @@
+"""Tests for timestamped logging helpers (tag parsing and level gating)."""
+
+import pytest
+
+from utils import log_utils
+from utils.log_utils import _format_message, _split_tags, log, set_log_level, tprint
+
+
+@pytest.fixture(autouse=True)
+def restore_level():
+    previous = log_utils._min_level
+    yield
+    log_utils._min_level = previous
+
+
+class TestSplitTags:
+    """Test suite for _split_tags."""
+
+    def test_no_tags(self):
+        """Test that untagged messages are returned unchanged."""
+        assert _split_tags("hello world") == ([], "hello world")
+
+    def test_multiple_tags_with_whitespace(self):
+        """Test that leading tags are collected and stripped."""
+        assert _split_tags("  [DEEP] [ VOICE ][x]  rest [y]") == (
+            ["DEEP", "VOICE", "x"],
+            "rest [y]",
+        )
+
+    def test_unterminated_tag_stops_parsing(self):
+        """Test that a tag without a closing bracket is left in the text."""
+        assert _split_tags("[A][B no end") == (["A"], "[B no end")
+
+    def test_empty_tag_stops_parsing(self):
+        """Test that an empty tag ends tag collection."""
+        assert _split_tags("[A][ ] text") == (["A"], "[ ] text")
+
+
+class TestFormatMessage:
+    """Test suite for _format_message."""
+
+    def test_level_first_is_reordered(self):
+        """Test that a leading level tag is moved after the system tag."""
+        assert _format_message("[DEEP][GESTURE] emit") == "[GESTURE][DEEP] emit"
+
+    def test_system_only(self):
+        """Test that a single system tag is kept."""
+        assert _format_message("[VOICE] Transcript: hi") == "[VOICE] Transcript: hi"
+
+    def test_untagged_defaults_to_app(self):
+        """Test that untagged messages are attributed to APP."""
+        assert _format_message("hello") == "[APP] hello"
+
+
+class TestLevelGating:
+    """Test suite for log-level filtering in tprint/log."""
+
+    def test_tprint_drops_levels_below_threshold(self, capsys):
+        """Test that DEEP-tagged messages are dropped at INFO level."""
+        set_log_level("INFO")
+        tprint("[DEEP][GESTURE] hidden")
+        tprint("[GESTURE] shown")
+
+        out = capsys.readouterr().out
+        assert "hidden" not in out
+        assert "[GESTURE] shown" in out
+
+    def test_tprint_keeps_everything_at_deep(self, capsys):
+        """Test that DEEP level lets deep traces through."""
+        set_log_level("DEEP")
+        tprint("[DEEP][GESTURE] visible")
+
+        assert "[GESTURE][DEEP] visible" in capsys.readouterr().out
+
+    def test_log_gates_on_variant(self, capsys):
+        """Test that log() filters by its explicit variant."""
+        set_log_level("WARN")
+        log("VOICE", "quiet", variant="DEBUG")
+        log("VOICE", "loud", variant="ERROR")
+
+        out = capsys.readouterr().out
+        assert "quiet" not in out
+        assert "[VOICE][ERROR] loud" in out
+
+    def test_untagged_messages_pass_in_both_helpers(self, capsys):
+        """Test that log() and tprint() agree that messages without a level are kept."""
+        set_log_level("ERROR")
+        log("VOICE", "plain")
+        log("VOICE", "labelled", variant="mic")
+        tprint("[VOICE] direct")
+
+        out = capsys.readouterr().out
+        assert "[VOICE] plain" in out
+        assert "[VOICE][mic] labelled" in out
+        assert "[VOICE] direct" in out
+
+    def test_unknown_level_defaults_to_info(self):
+        """Test that an unrecognized level falls back to INFO."""
+        set_log_level("verbose")
+        assert log_utils.current_level_int() == log_utils._LEVEL_ORDER["INFO"]
@@ -0,0 +1,253 @@
+"""Tests for SpeechToTextEngine configuration and dispatch (Whisper is faked)."""
+
+import asyncio
+import io
+import sys
+import threading
+from types import ModuleType, SimpleNamespace
+
+import numpy as np
+import pytest
+
+from voice_module.stt_engine import SpeechToTextEngine
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    for name in (
+        "LOCAL_WHISPER_DEVICE",
+        "LOCAL_WHISPER_COMPUTE_TYPE",
+        "LOCAL_WHISPER_DOWNLOAD_ROOT",
+        "LOCAL_WHISPER_CPU_THREADS",
+        "STT_PROVIDER",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+def _fake_ctranslate2(monkeypatch, cuda_devices):
+    module = ModuleType("ctranslate2")
+    module.get_cuda_device_count = lambda: cuda_devices
+    monkeypatch.setitem(sys.modules, "ctranslate2", module)
+
+
+@pytest.fixture
+def fake_core(monkeypatch):
+    calls = []
+    module = ModuleType("fw_transcribe.core")
+
+    def transcribe_file(audio, **kwargs):
+        kwargs["thread"] = threading.current_thread().name
+        calls.append((audio, kwargs))
+        return SimpleNamespace(text="hello")
+
+    module.transcribe_file = transcribe_file
+    module.get_model = lambda *args, **kwargs: calls.append(("get_model", args, kwargs))
+    monkeypatch.setitem(sys.modules, "fw_transcribe.core", module)
+    return calls
+
+
+class TestDeviceSelection:
+    """Test suite for Whisper device/compute defaults."""
+
+    def test_gpu_defaults_to_cuda_int8_float16(self, clean_env):
+        """Test that a visible GPU selects CUDA with int8 weights and float16 activations."""
+        _fake_ctranslate2(clean_env, cuda_devices=1)
+
+        engine = SpeechToTextEngine()
+
+        assert (engine.device, engine.compute_type) == ("cuda", "int8_float16")
+
+    def test_no_gpu_defaults_to_cpu_int8(self, clean_env):
+        """Test that without a GPU the CPU/int8 defaults are kept."""
+        _fake_ctranslate2(clean_env, cuda_devices=0)
+
+        engine = SpeechToTextEngine()
+
+        assert (engine.device, engine.compute_type) == ("cpu", "int8")
+
+    def test_env_overrides_detection(self, clean_env):
+        """Test that explicit settings win over detection."""
+        _fake_ctranslate2(clean_env, cuda_devices=1)
+        clean_env.setenv("LOCAL_WHISPER_DEVICE", "cpu")
+        clean_env.setenv("LOCAL_WHISPER_COMPUTE_TYPE", "float32")
+
+        engine = SpeechToTextEngine()
+
+        assert (engine.device, engine.compute_type) == ("cpu", "float32")
+
+    def test_cuda_load_failure_falls_back_to_cpu(self, clean_env, fake_core):
+        """Test that an auto-selected GPU without CUDA libraries falls back to CPU/int8."""
+        _fake_ctranslate2(clean_env, cuda_devices=1)
+
+        def get_model(model_path, device, compute_type, download_root, cpu_threads):
+            if device == "cuda":
+                raise RuntimeError("Library cublas64_12.dll is not found")
+            fake_core.append(("get_model", (model_path, device, compute_type)))
+
+        sys.modules["fw_transcribe.core"].get_model = get_model
+        engine = SpeechToTextEngine()
+
+        engine.warm_up()
+
+        assert (engine.device, engine.compute_type) == ("cpu", "int8")
+        assert fake_core == [("get_model", ("small", "cpu", "int8"))]
+
+    def test_detection_waits_for_first_use(self, clean_env):
+        """Test that constructing the engine does not import CTranslate2."""
+        clean_env.delitem(sys.modules, "ctranslate2", raising=False)
+
+        engine = SpeechToTextEngine()
+
+        assert "ctranslate2" not in sys.modules
+        _fake_ctranslate2(clean_env, cuda_devices=1)
+        assert engine.device == "cuda"
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ValueError("Invalid data found when processing input"),
+            RuntimeError("CUDA failed with error out of memory"),
+        ],
+    )
+    def test_input_and_oom_errors_keep_cuda(self, clean_env, fake_core, error):
+        """Test that a bad utterance or a one-off OOM does not move the session to CPU."""
+        _fake_ctranslate2(clean_env, cuda_devices=1)
+
+        def transcribe_file(audio, **kwargs):
+            raise error
+
+        sys.modules["fw_transcribe.core"].transcribe_file = transcribe_file
+        engine = SpeechToTextEngine()
+
+        with pytest.raises(type(error)):
+            engine._transcribe_wav_bytes(b"RIFFdata")
+        assert (engine.device, engine.compute_type) == ("cuda", "int8_float16")
+
+    def test_concurrent_failures_switch_once(self, clean_env, fake_core):
+        """Test that a second thread failing on CUDA retries on CPU without re-switching."""
+        _fake_ctranslate2(clean_env, cuda_devices=1)
+        engine = SpeechToTextEngine()
+        error = RuntimeError("cuDNN failed")
+        assert engine.device == "cuda"
+
+        assert engine._fall_back_to_cpu("cuda", error)
+        assert engine._fall_back_to_cpu("cuda", error)
+        assert not engine._fall_back_to_cpu("cpu", error)
+        assert (engine.device, engine.compute_type) == ("cpu", "int8")
+
+    def test_explicit_cuda_does_not_fall_back(self, clean_env, fake_core):
+        """Test that a GPU requested via the environment surfaces its failure."""
+        _fake_ctranslate2(clean_env, cuda_devices=1)
+        clean_env.setenv("LOCAL_WHISPER_DEVICE", "cuda")
+
+        def transcribe_file(audio, **kwargs):
+            raise RuntimeError("cuDNN failed")
+
+        sys.modules["fw_transcribe.core"].transcribe_file = transcribe_file
+
+        with pytest.raises(RuntimeError):
+            SpeechToTextEngine()._transcribe_wav_bytes(b"RIFFdata")
+
+    def test_setting_used_when_env_unset(self, clean_env):
+        """Test that the app-settings compute type applies unless the env overrides it."""
+        _fake_ctranslate2(clean_env, cuda_devices=0)
+
+        assert SpeechToTextEngine(compute_type="int8_float32").compute_type == "int8_float32"
+        clean_env.setenv("LOCAL_WHISPER_COMPUTE_TYPE", "float32")
+        assert SpeechToTextEngine(compute_type="int8_float32").compute_type == "float32"
+
+
+class TestTranscription:
+    """Test suite for WAV transcription dispatch."""
+
+    def test_wav_bytes_are_passed_in_memory(self, clean_env, fake_core):
+        """Test that WAV bytes reach Whisper as a file object, not a temp path."""
+        _fake_ctranslate2(clean_env, cuda_devices=0)
+        engine = SpeechToTextEngine()
+
+        text = engine._transcribe_wav_bytes(b"RIFFdata")
+
+        assert text == "hello"
+        audio, kwargs = fake_core[0]
+        assert isinstance(audio, io.BytesIO)
+        assert audio.getvalue() == b"RIFFdata"
+        assert kwargs["model_size"] == engine.model_path
+
+    def test_empty_audio_skips_whisper(self, clean_env, fake_core):
+        """Test that empty input never loads the model."""
+        _fake_ctranslate2(clean_env, cuda_devices=0)
+
+        assert SpeechToTextEngine()._transcribe_wav_bytes(b"") == ""
+        assert fake_core == []
+
+    def test_waveform_is_passed_as_float32(self, clean_env, fake_core):
+        """Test that a 16 kHz waveform reaches Whisper without a WAV round trip."""
+        _fake_ctranslate2(clean_env, cuda_devices=0)
+        engine = SpeechToTextEngine()
+        waveform = np.array([0.0, 0.5, -0.5], dtype=np.float64)
+
+        text = asyncio.run(engine.transcribe_audio_array(waveform, 16000))
+
+        assert text == "hello"
+        audio, _kwargs = fake_core[0]
+        assert audio.dtype == np.float32
+        np.testing.assert_array_equal(audio, waveform)
+
+    def test_waveform_at_other_rate_is_rejected(self, clean_env, fake_core):
+        """Test that non-16 kHz waveforms are refused rather than mis-transcribed."""
+        _fake_ctranslate2(clean_env, cuda_devices=0)
+
+        with pytest.raises(ValueError):
+            asyncio.run(SpeechToTextEngine().transcribe_audio_array(np.zeros(4), 44100))
+
+    def test_inference_runs_on_dedicated_worker(self, clean_env, fake_core):
+        """Test that Whisper runs on the engine's own thread, not the default executor."""
+        _fake_ctranslate2(clean_env, cuda_devices=0)
+
+        asyncio.run(SpeechToTextEngine().transcribe_wav_bytes(b"RIFFdata"))
+
+        assert fake_core[0][1]["thread"].startswith("whisper")
+
+    def test_cuda_decode_failure_retries_on_cpu(self, clean_env, fake_core):
+        """Test that a failed first decode on an auto-selected GPU is retried on CPU."""
+        _fake_ctranslate2(clean_env, cuda_devices=1)
+        core = sys.modules["fw_transcribe.core"]
+        transcribe = core.transcribe_file
+
+        def transcribe_file(audio, **kwargs):
+            if kwargs["device"] == "cuda":
+                audio.read()
+                raise RuntimeError("Library cublas64_12.dll is not found")
+            return transcribe(audio, **kwargs)
+
+        core.transcribe_file = transcribe_file
+
+        assert SpeechToTextEngine()._transcribe_wav_bytes(b"RIFFdata") == "hello"
+        audio, kwargs = fake_core[0]
+        assert (kwargs["device"], kwargs["compute_type"]) == ("cpu", "int8")
+        assert audio.read() == b"RIFFdata"
+
+    def test_download_root_is_forwarded(self, clean_env, fake_core):
+        """Test that a persistent model directory reaches warm-up and transcription."""
+        _fake_ctranslate2(clean_env, cuda_devices=0)
+        clean_env.setenv("LOCAL_WHISPER_DOWNLOAD_ROOT", "/models/whisper")
+        engine = SpeechToTextEngine()
+
+        engine.warm_up()
+        engine._transcribe_wav_bytes(b"RIFFdata")
+
+        assert fake_core[0][:2] == ("get_model", ("small", "cpu", "int8", "/models/whisper"))
+        assert fake_core[1][1]["download_root"] == "/models/whisper"
+
+    def test_cpu_threads_are_forwarded(self, clean_env, fake_core):
+        """Test that LOCAL_WHISPER_CPU_THREADS reaches model load and transcription."""
+        _fake_ctranslate2(clean_env, cuda_devices=0)
+        clean_env.setenv("LOCAL_WHISPER_CPU_THREADS", "6")
+        engine = SpeechToTextEngine()
+
+        engine.warm_up()
+        engine._transcribe_wav_bytes(b"RIFFdata")
+
+        assert fake_core[0][2] == {"cpu_threads": 6}
+        assert fake_core[1][1]["cpu_threads"] == 6
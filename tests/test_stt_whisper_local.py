@@ -0,0 +1,197 @@
+"""Tests for WhisperLocalEngine audio handling (faster-whisper is faked)."""
+
+import asyncio
+import base64
+import io
+import sys
+import threading
+import wave
+from types import ModuleType, SimpleNamespace
+
+import numpy as np
+import pytest
+
+from voice_module import stt_whisper_local
+from voice_module.stt_whisper_local import WhisperLocalEngine
+
+
+class _FakeWhisperModel:
+    """Records constructor kwargs and the audio each transcribe call receives."""
+
+    instances = 0
+
+    def __init__(self, model_path, **kwargs):
+        type(self).instances += 1
+        self.kwargs = kwargs
+        self.audio = []
+
+    def transcribe(self, audio, **kwargs):
+        self.audio.append(np.array(audio, copy=True))
+        return [SimpleNamespace(text=f" {len(audio)} ")], None
+
+
+@pytest.fixture
+def fake_whisper(monkeypatch):
+    module = ModuleType("faster_whisper")
+    module.WhisperModel = _FakeWhisperModel
+    _FakeWhisperModel.instances = 0
+    monkeypatch.setitem(sys.modules, "faster_whisper", module)
+    monkeypatch.setattr(stt_whisper_local, "_models", {})
+    return _FakeWhisperModel
+
+
+def _wav(samples: np.ndarray, channels: int, rate: int = 16000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(samples.dtype.itemsize)
+        wav_file.setframerate(rate)
+        wav_file.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+class TestConversion:
+    """Test suite for PCM to float32 conversion."""
+
+    def test_pcm16_matches_reference_scale(self):
+        """Test that PCM16 maps to float32 in [-1, 1]."""
+        samples = np.array([-32768, -1, 0, 1, 32767], dtype=np.int16)
+
+        result = WhisperLocalEngine()._pcm16_to_float(samples.tobytes())
+
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, samples.astype(np.float32) / 32768.0)
+
+    def test_stereo_downmix_matches_mean(self):
+        """Test that the fused downmix equals the per-channel mean."""
+        frames = np.random.default_rng(0).integers(-32768, 32767, size=(64, 2)).astype(np.int16)
+
+        result = WhisperLocalEngine()._pcm16_stereo_to_mono_float(frames.tobytes())
+
+        expected = (frames.astype(np.float32) / 32768.0).mean(axis=1)
+        np.testing.assert_allclose(result, expected, atol=1e-7)
+
+    def test_pcm8_is_centered(self):
+        """Test that unsigned PCM8 is re-centered around zero."""
+        samples = np.array([0, 128, 255], dtype=np.uint8)
+
+        result = WhisperLocalEngine()._pcm8_to_float(samples.tobytes())
+
+        np.testing.assert_array_equal(result, [-1.0, 0.0, 127 / 128])
+
+
+class TestTranscribe:
+    """Test suite for the transcription entry points."""
+
+    def test_import_does_not_load_faster_whisper(self):
+        """Test that the module imports without faster-whisper until a model is needed."""
+        assert WhisperLocalEngine()._model is None
+
+    def test_stereo_wav_is_downmixed(self, fake_whisper):
+        """Test that stereo WAV input reaches Whisper as mono audio."""
+        frames = np.full((100, 2), 16384, dtype=np.int16)
+        engine = WhisperLocalEngine()
+
+        assert engine.transcribe_wav_bytes(_wav(frames, channels=2)) == "100"
+        np.testing.assert_allclose(engine._model.audio[0], 0.5)
+
+    def test_stream_accepts_buffers_and_base64(self, fake_whisper):
+        """Test that memoryview, bytearray and base64 str chunks are joined in order."""
+        chunk = np.arange(1, 5, dtype=np.int16) * 1000
+        encoded = base64.b64encode(chunk.tobytes()).decode()
+        stream = [memoryview(chunk), bytearray(chunk.tobytes()), encoded]
+        engine = WhisperLocalEngine()
+
+        assert asyncio.run(engine.transcribe_stream(stream)) == "12"
+        np.testing.assert_array_equal(engine._model.audio[0], np.tile(chunk, 3) / 32768.0)
+
+    def test_single_memoryview_chunk_is_not_copied(self, fake_whisper, monkeypatch):
+        """Test that a lone buffer chunk reaches conversion without a join copy."""
+        engine = WhisperLocalEngine()
+        seen = []
+        convert = engine._pcm16_to_float
+
+        def _record(data):
+            seen.append(data)
+            return convert(data)
+
+        monkeypatch.setattr(engine, "_pcm16_to_float", _record)
+        chunk = memoryview(np.full(8, 1000, dtype=np.int16))
+
+        assert asyncio.run(engine.transcribe_stream([chunk])) == "8"
+        assert seen[0] is chunk
+
+    def test_stream_accepts_async_iterables(self, fake_whisper):
+        """Test that async chunk sources are consumed directly."""
+
+        async def chunks():
+            yield np.int16(1000).tobytes()
+            yield np.int16(-1000).tobytes()
+
+        assert asyncio.run(WhisperLocalEngine().transcribe_stream(chunks())) == "2"
+
+    def test_warm_up_loads_model_once(self, fake_whisper):
+        """Test that warm-up and later requests share one model instance."""
+        engine = WhisperLocalEngine()
+
+        asyncio.run(engine.warm_up())
+        engine.transcribe_audio_bytes(np.int16(1000).tobytes())
+
+        assert fake_whisper.instances == 1
+        assert engine._model.kwargs["num_workers"] == 1
+
+    def test_concurrent_streams_keep_their_own_audio(self, fake_whisper):
+        """Test that overlapping decodes on one engine each see their own samples."""
+        engine = WhisperLocalEngine()
+        model = engine._ensure_model()
+        both_converted = threading.Barrier(2, timeout=5)
+        transcribe = model.transcribe
+
+        def _wait_then_transcribe(audio, **kwargs):
+            # Both conversions have finished before either decode reads audio.
+            both_converted.wait()
+            return transcribe(audio, **kwargs)
+
+        model.transcribe = _wait_then_transcribe
+        first = np.full(4, 10000, dtype=np.int16).tobytes()
+        second = np.full(4, -20000, dtype=np.int16).tobytes()
+
+        async def run_both():
+            return await asyncio.gather(
+                engine.transcribe_stream([first]), engine.transcribe_stream([second])
+            )
+
+        asyncio.run(run_both())
+
+        heard = sorted(float(audio[0]) for audio in model.audio)
+        assert heard == pytest.approx([-20000 / 32768.0, 10000 / 32768.0])
+
+    def test_engines_share_one_model(self, fake_whisper):
+        """Test that engines with the same configuration reuse one loaded model."""
+        first = WhisperLocalEngine(model_path="tiny")
+        second = WhisperLocalEngine(model_path="tiny")
+
+        assert first._ensure_model() is second._ensure_model()
+        assert fake_whisper.instances == 1
+
+
+class TestTrimSilence:
+    """Test suite for edge-silence trimming before inference."""
+
+    def test_silent_audio_skips_model(self, fake_whisper):
+        """Test that all-silent input returns empty text without loading Whisper."""
+        engine = WhisperLocalEngine()
+
+        assert engine.transcribe_audio_bytes(np.zeros(1600, dtype=np.int16).tobytes()) == ""
+        assert fake_whisper.instances == 0
+
+    def test_edges_are_trimmed_with_padding(self):
+        """Test that silence beyond the padding is cut on both sides."""
+        engine = WhisperLocalEngine(sample_rate=100)
+        audio = np.zeros(100, dtype=np.float32)
+        audio[40:50] = 0.5
+
+        trimmed = engine._trim_silence(audio)
+
+        assert trimmed.size == 10 + 2 * 10
+        assert trimmed[10] == 0.5 and trimmed[-11] == 0.5
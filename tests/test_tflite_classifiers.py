@@ -0,0 +1,115 @@
+"""Tests for the TFLite classifier wrappers (interpreter is faked)."""
+
+import numpy as np
+import pytest
+
+from video_module import tflite_classifiers
+from video_module.tflite_classifiers import KeyPointClassifier, PointHistoryClassifier
+
+
+class FakeInterpreter:
+    """Minimal tf.lite.Interpreter stand-in computing ``softmax(x @ weights)``."""
+
+    def __init__(self, weights: np.ndarray):
+        self.weights = weights.astype(np.float32)
+        self.input_shape = np.array([1, weights.shape[0]], dtype=np.int32)
+        self.invocations = 0
+        self._input = np.zeros(self.input_shape, dtype=np.float32)
+        self._output = np.zeros((1, weights.shape[1]), dtype=np.float32)
+
+    def allocate_tensors(self):
+        self._input = np.zeros(self.input_shape, dtype=np.float32)
+        self._output = np.zeros((self.input_shape[0], self.weights.shape[1]), dtype=np.float32)
+
+    def get_input_details(self):
+        return [{"index": 0, "shape": self.input_shape.copy()}]
+
+    def get_output_details(self):
+        return [{"index": 1, "shape": np.array(self._output.shape, dtype=np.int32)}]
+
+    def set_tensor(self, index, value):
+        assert index == 0
+        assert value.shape == self._input.shape
+        self._input[...] = value
+
+    def invoke(self):
+        self.invocations += 1
+        logits = self._input @ self.weights
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        self._output[...] = exp / exp.sum(axis=1, keepdims=True)
+
+    def tensor(self, index):
+        assert index in (0, 1)
+        return lambda: self._input if index == 0 else self._output
+
+    def get_tensor(self, index):
+        assert index == 1
+        return self._output.copy()
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    path = tmp_path / "model.tflite"
+    path.write_bytes(b"")
+    return path
+
+
+@pytest.fixture
+def fake_interpreter(monkeypatch):
+    weights = np.zeros((4, 3), dtype=np.float32)
+    weights[0, 0] = 5.0
+    weights[1, 1] = 5.0
+    weights[2, 2] = 5.0
+    interpreter = FakeInterpreter(weights)
+    monkeypatch.setattr(tflite_classifiers, "_load_interpreter", lambda _path: interpreter)
+    return interpreter
+
+
+class TestKeyPointClassifier:
+    """Test suite for KeyPointClassifier."""
+
+    def test_missing_model_raises(self, tmp_path):
+        """Test that a missing model file is reported."""
+        with pytest.raises(FileNotFoundError):
+            KeyPointClassifier(tmp_path / "missing.tflite")
+
+    def test_single_frame_returns_argmax(self, model_path, fake_interpreter):
+        """Test that a single feature vector yields the best class and its score."""
+        classifier = KeyPointClassifier(model_path)
+
+        idx, score = classifier([0.0, 1.0, 0.0, 0.0])
+
+        assert idx == 1
+        assert 0.9 < score <= 1.0
+
+    def test_accepts_preprocessed_array(self, model_path, fake_interpreter):
+        """Test that a float32 feature array classifies like the equivalent list."""
+        classifier = KeyPointClassifier(model_path)
+        features = np.array([0.0, 0.0, 1.0, 0.0], dtype=np.float32)
+
+        assert classifier(features) == classifier(features.tolist())
+
+    def test_single_frame_writes_tensor_in_place(self, model_path, fake_interpreter, monkeypatch):
+        """Test that per-frame inference bypasses the set_tensor/get_tensor copies."""
+        classifier = KeyPointClassifier(model_path)
+
+        def _fail(*_args):
+            raise AssertionError("copying tensor API used")
+
+        monkeypatch.setattr(fake_interpreter, "set_tensor", _fail)
+        monkeypatch.setattr(fake_interpreter, "get_tensor", _fail)
+
+        assert classifier([0.0, 0.0, 1.0, 0.0])[0] == 2
+
+
+class TestPointHistoryClassifier:
+    """Test suite for PointHistoryClassifier."""
+
+    def test_low_confidence_returns_invalid_value(self, model_path, fake_interpreter):
+        """Test that scores under the threshold map to the invalid id."""
+        classifier = PointHistoryClassifier(model_path, score_threshold=0.9, invalid_value=-1)
+
+        idx, score = classifier([0.0, 0.0, 0.0, 1.0])
+
+        assert idx == -1
+        assert score < 0.9
@@ -0,0 +1,219 @@
+"""Tests for the TFLite landmark preprocessing helpers."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from video_module import tflite_pipeline
+from video_module.tflite_pipeline import (
+    PointHistoryBuffer,
+    calc_landmark_list,
+    landmarks_to_features,
+    pre_process_landmark,
+    pre_process_point_history,
+)
+
+
+class _Frame:
+    """Stand-in for an image; only ``shape`` is read by the helpers."""
+
+    def __init__(self, width: int, height: int):
+        self.shape = (height, width, 3)
+
+
+def _reference_pre_process_landmark(landmark_list):
+    base_x, base_y = landmark_list[0]
+    flat = []
+    for x, y in landmark_list:
+        flat.extend([x - base_x, y - base_y])
+    max_value = max(abs(value) for value in flat) or 1
+    return [value / max_value for value in flat]
+
+
+class TestPreProcessLandmark:
+    """Test suite for pre_process_landmark."""
+
+    def test_matches_reference_normalization(self):
+        """Test that the vectorized path matches the original list-based math."""
+        rng = np.random.default_rng(0)
+        landmarks = rng.integers(0, 640, size=(21, 2)).tolist()
+
+        result = pre_process_landmark(landmarks)
+
+        assert result.dtype == np.float32
+        assert result.shape == (42,)
+        np.testing.assert_allclose(
+            result, _reference_pre_process_landmark(landmarks), rtol=1e-6
+        )
+
+    def test_wrist_is_origin_and_values_are_bounded(self):
+        """Test that the first landmark maps to the origin and max |value| is 1."""
+        landmarks = [[100, 200]] + [[100 + i, 200 - 2 * i] for i in range(1, 21)]
+
+        result = pre_process_landmark(landmarks)
+
+        assert result[0] == 0.0 and result[1] == 0.0
+        assert float(np.abs(result).max()) == pytest.approx(1.0)
+
+    def test_does_not_mutate_input(self):
+        """Test that the caller's landmark list is left untouched."""
+        landmarks = [[10, 20], [30, 40], [50, 60]]
+
+        pre_process_landmark(landmarks)
+
+        assert landmarks == [[10, 20], [30, 40], [50, 60]]
+
+    def test_returns_independent_arrays(self):
+        """Test that results are not views into the shared scratch buffer."""
+        first = pre_process_landmark([[0, 0], [4, 2]])
+        second = pre_process_landmark([[0, 0], [1, 3]])
+
+        np.testing.assert_allclose(first, [0.0, 0.0, 1.0, 0.5])
+        np.testing.assert_allclose(second, [0.0, 0.0, 1.0 / 3.0, 1.0], rtol=1e-6)
+
+    def test_all_identical_points_returns_zeros(self):
+        """Test that a degenerate hand does not divide by zero."""
+        result = pre_process_landmark([[5, 5]] * 21)
+        assert not np.any(result)
+
+    def test_empty_input(self):
+        """Test that an empty landmark list yields an empty feature vector."""
+        assert pre_process_landmark([]).size == 0
+
+
+def _raw_landmarks(seed):
+    rng = np.random.default_rng(seed)
+    # Include out-of-frame values to exercise truncation and clamping.
+    raw = rng.uniform(-0.05, 1.05, size=(21, 2))
+    return SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y)) for x, y in raw])
+
+
+class TestCalcLandmarkList:
+    """Test suite for calc_landmark_list."""
+
+    def test_matches_per_landmark_int_math(self):
+        """Test that vectorized snapping equals int() truncation and clamping."""
+        landmarks = _raw_landmarks(4)
+        frame = _Frame(width=640, height=480)
+        expected = [
+            [min(int(lm.x * 640), 639), min(int(lm.y * 480), 479)]
+            for lm in landmarks.landmark
+        ]
+
+        result = calc_landmark_list(frame, landmarks)
+
+        assert result.dtype == np.int32
+        assert result.tolist() == expected
+
+
+class TestLandmarksToFeatures:
+    """Test suite for the fused landmarks_to_features path."""
+
+    def test_matches_two_step_pipeline(self):
+        """Test that fusion matches calc_landmark_list + pre_process_landmark."""
+        landmarks = _raw_landmarks(3)
+        frame = _Frame(width=640, height=480)
+
+        fused = landmarks_to_features(frame, landmarks)
+        expected = pre_process_landmark(calc_landmark_list(frame, landmarks))
+
+        assert fused.dtype == np.float32
+        np.testing.assert_array_equal(fused, expected)
+
+    def test_empty_landmarks(self):
+        """Test that no landmarks yield an empty feature vector."""
+        assert landmarks_to_features(_Frame(10, 10), SimpleNamespace(landmark=[])).size == 0
+
+
+class TestPreProcessPointHistory:
+    """Test suite for pre_process_point_history."""
+
+    def test_offsets_are_scaled_by_frame_size(self):
+        """Test that points are relative to the first point and frame-normalized."""
+        frame = _Frame(width=200, height=100)
+        history = [[50, 50], [70, 40], [150, 100]]
+
+        result = pre_process_point_history(frame, history)
+
+        np.testing.assert_allclose(result, [0.0, 0.0, 0.1, -0.1, 0.5, 0.5], rtol=1e-6)
+
+    def test_accepts_integer_arrays(self):
+        """Test that int32 ring-buffer views are not truncated."""
+        frame = _Frame(width=640, height=480)
+        history = np.array([[0, 0], [320, 240]], dtype=np.int32)
+
+        result = pre_process_point_history(frame, history)
+
+        np.testing.assert_allclose(result, [0.0, 0.0, 0.5, 0.5])
+        assert history.tolist() == [[0, 0], [320, 240]]
+
+    def test_empty_history(self):
+        """Test that an empty history yields an empty feature vector."""
+        assert pre_process_point_history(_Frame(10, 10), []).size == 0
+
+
+class TestPointHistoryBuffer:
+    """Test suite for the ring-backed PointHistoryBuffer."""
+
+    def test_partial_fill_keeps_insertion_order(self):
+        """Test that a partially filled buffer returns only appended points."""
+        buffer = PointHistoryBuffer(maxlen=4)
+        buffer.append([1, 2])
+        buffer.zeros()
+
+        assert len(buffer) == 2
+        assert buffer.as_list() == [[1, 2], [0, 0]]
+
+    def test_wraparound_returns_oldest_first(self):
+        """Test that the oldest points are evicted once the ring is full."""
+        buffer = PointHistoryBuffer(maxlen=3)
+        for i in range(5):
+            buffer.append((i, i * 10))
+
+        assert len(buffer) == 3
+        assert buffer.as_array().tolist() == [[2, 20], [3, 30], [4, 40]]
+
+    def test_normalized_matches_pre_process_point_history(self):
+        """Test that the in-place features equal the allocating helper's output."""
+        rng = np.random.default_rng(5)
+        buffer = PointHistoryBuffer(maxlen=4)
+        frame = _Frame(width=640, height=480)
+        for point in rng.integers(0, 480, size=(6, 2)).tolist():
+            buffer.append(point)
+            expected = pre_process_point_history(frame, buffer.as_list())
+
+            result = buffer.normalized(frame)
+
+            assert result.dtype == np.float32
+            np.testing.assert_array_equal(result, expected)
+
+    def test_normalized_empty_buffer(self):
+        """Test that an empty buffer yields an empty feature vector."""
+        assert PointHistoryBuffer(maxlen=4).normalized(_Frame(10, 10)).size == 0
+
+
+class TestKernelFallbacks:
+    """Test that the Numba-compilable loops match the NumPy fallbacks."""
+
+    def test_point_history_loop_matches_numpy(self):
+        """Test that the loop kernel writes the same offsets as NumPy."""
+        points = np.random.default_rng(6).integers(0, 640, size=(16, 2)).astype(np.int32)
+        via_loop = np.empty((16, 2), dtype=np.float32)
+        via_numpy = np.empty((16, 2), dtype=np.float32)
+
+        tflite_pipeline._offset_point_history_loop(points, via_loop, 1 / 640, 1 / 480)
+        tflite_pipeline._offset_point_history_numpy(points, via_numpy, 1 / 640, 1 / 480)
+
+        np.testing.assert_array_equal(via_loop, via_numpy)
+
+    def test_landmark_loop_matches_numpy(self):
+        """Test that the fused landmark loop matches the NumPy normalization."""
+        coords = np.random.default_rng(7).integers(0, 640, size=(21, 2)).astype(np.float32)
+        via_loop = coords.copy()
+        via_numpy = coords.copy()
+
+        tflite_pipeline._normalize_landmarks_loop(via_loop)
+        tflite_pipeline._normalize_landmarks_numpy(via_numpy)
+
+        np.testing.assert_allclose(via_loop, via_numpy, rtol=1e-6)
@@ -0,0 +1,140 @@
+"""Tests for the background frame grabber (camera is faked)."""
+
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+from video_module.video_stream import FrameGrabber, VideoStream
+
+
+class _FakeStream:
+    """Yields numbered frames, then a failed read once exhausted."""
+
+    def __init__(
+        self, frames: int, gate: threading.Event | None = None, first_delay: float = 0.0
+    ):
+        self.remaining = frames
+        self.count = 0
+        self.gate = gate
+        self.first_delay = first_delay
+
+    def read(self):
+        if self.gate is not None:
+            self.gate.wait(timeout=2)
+        if self.count == 0 and self.first_delay:
+            time.sleep(self.first_delay)
+        if self.remaining <= 0:
+            return False, None
+        self.remaining -= 1
+        self.count += 1
+        return True, self.count
+
+
+class TestFrameGrabber:
+    """Test suite for FrameGrabber."""
+
+    def test_reports_failed_read_after_last_frame(self):
+        """Test that a camera failure reaches the consumer instead of hanging."""
+        grabber = FrameGrabber(_FakeStream(frames=0))
+        grabber.start()
+
+        assert grabber.read() == (False, None)
+        grabber.stop()
+
+    def test_keeps_only_newest_frame(self):
+        """Test that frames the consumer missed are dropped, not queued."""
+        stream = _FakeStream(frames=3)
+        grabber = FrameGrabber(stream)
+        grabber.start()
+        grabber._thread.join(timeout=2)
+
+        assert grabber.read() == (False, None)
+        assert grabber.read() == (False, None)
+        assert stream.count == 3
+
+    def test_waits_for_slow_first_frame(self):
+        """Test that a camera slow to start is waited for, not reported as failed."""
+        grabber = FrameGrabber(_FakeStream(frames=10**9, first_delay=0.3))
+        grabber.start()
+        ok, frame = grabber.read()
+
+        grabber.stop()
+
+        assert ok and frame >= 1
+
+    def test_read_timeout_is_opt_in(self):
+        """Test that an explicit timeout gives up while the worker is still reading."""
+        gate = threading.Event()
+        grabber = FrameGrabber(_FakeStream(frames=1, gate=gate))
+        grabber.start()
+
+        assert grabber.read(timeout=0.1) == (False, None)
+        assert grabber.is_alive()
+        gate.set()
+        grabber.stop()
+
+    def test_stop_joins_worker(self):
+        """Test that stop() waits for the worker so the capture can be released."""
+        gate = threading.Event()
+        grabber = FrameGrabber(_FakeStream(frames=10**9, gate=gate))
+        grabber.start()
+        gate.set()
+        ok, frame = grabber.read()
+
+        grabber.stop()
+
+        assert ok and frame >= 1
+        assert grabber._thread is None
+
+    def test_stop_gives_up_on_stalled_read(self, monkeypatch):
+        """Test that stop() returns even if a camera read never completes."""
+        monkeypatch.setattr("video_module.video_stream._STOP_JOIN_SECS", 0.1)
+        gate = threading.Event()
+        grabber = FrameGrabber(_FakeStream(frames=1, gate=gate))
+        grabber.start()
+
+        started = time.monotonic()
+        grabber.stop()
+
+        assert time.monotonic() - started < 1.0
+        assert grabber._thread is None
+        gate.set()
+
+
+class _FakeCapture:
+    def __init__(self, index):
+        self.index = index
+        self.props = {}
+
+    def isOpened(self):
+        return True
+
+    def set(self, prop, value):
+        self.props[prop] = value
+        return True
+
+    def release(self):
+        pass
+
+
+class TestVideoStream:
+    """Test suite for VideoStream capture configuration."""
+
+    def test_open_configures_low_latency_capture(self, monkeypatch):
+        """Test that buffer size, MJPG and requested resolution are applied."""
+        fake_cv2 = SimpleNamespace(
+            VideoCapture=_FakeCapture,
+            VideoWriter_fourcc=lambda *chars: "".join(chars),
+            CAP_PROP_BUFFERSIZE="buffersize",
+            CAP_PROP_FOURCC="fourcc",
+            CAP_PROP_FRAME_WIDTH="width",
+            CAP_PROP_FRAME_HEIGHT="height",
+        )
+        monkeypatch.setitem(sys.modules, "cv2", fake_cv2)
+        stream = VideoStream(2, width=640)
+
+        stream.open()
+
+        assert stream._cap.index == 2
+        assert stream._cap.props == {"buffersize": 1, "fourcc": "MJPG", "width": 640}
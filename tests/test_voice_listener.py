@@ -0,0 +1,447 @@
+"""Tests for VoiceListener audio helpers (no microphone or Whisper needed)."""
+
+import asyncio
+import io
+import math
+import sys
+import threading
+import time
+import wave
+from collections import deque
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from voice_module.voice_listener import VoiceListener, _energy_to_level, _sum_of_squares
+
+
+@pytest.fixture
+def listener(monkeypatch):
+    monkeypatch.setenv("LOCAL_WHISPER_DEVICE", "cpu")
+    return VoiceListener(controller=None)
+
+
+def _pcm(values) -> bytes:
+    return np.asarray(values, dtype=np.int16).tobytes()
+
+
+class _FakeInputStream:
+    """Delivers scripted chunks to the stream callback, then silence until closed."""
+
+    def __init__(self, chunks, chunk_size, callback):
+        self.chunks = chunks
+        self.silence = _pcm([0] * chunk_size)
+        self.callback = callback
+        self.closed = False
+        self._running = threading.Event()
+        self._running.set()
+        self._thread = threading.Thread(target=self._pump, daemon=True)
+        self._thread.start()
+
+    def _pump(self):
+        while self._running.is_set():
+            data = self.chunks.pop(0) if self.chunks else self.silence
+            self.callback(data, len(data) // 2, {}, 0)
+            time.sleep(0.001)
+
+    def stop_stream(self):
+        self._running.clear()
+        self._thread.join(timeout=1)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_pyaudio(monkeypatch):
+    opened = []
+    opened_chunks: list[bytes] = []
+
+    class PyAudio:
+        def open(self, **kwargs):
+            stream = _FakeInputStream(
+                opened_chunks, kwargs["frames_per_buffer"], kwargs["stream_callback"]
+            )
+            opened.append(stream)
+            return stream
+
+        def terminate(self):
+            pass
+
+    module = SimpleNamespace(PyAudio=PyAudio, paInt16=8, paContinue=0, paAbort=2)
+    monkeypatch.setitem(sys.modules, "pyaudio", module)
+    return SimpleNamespace(chunks=opened_chunks, streams=opened)
+
+
+class TestAudioLevel:
+    """Test suite for the chunk energy and level helpers."""
+
+    def test_matches_rms_definition(self):
+        """Test that the level is the PCM16 RMS scaled to [0, 1]."""
+        values = [1000, -2000, 3000, -4000]
+        expected = math.sqrt(sum(v * v for v in values) / len(values)) / 32768.0
+
+        energy = _sum_of_squares(np.array(values, dtype=np.int16))
+
+        assert energy == sum(v * v for v in values)
+        assert _energy_to_level(energy, len(values)) == pytest.approx(expected)
+
+    def test_full_scale_does_not_overflow(self):
+        """Test that squares of full-scale samples are not wrapped."""
+        samples = np.full(8, -32768, dtype=np.int16)
+
+        assert _energy_to_level(_sum_of_squares(samples), samples.size) == 1.0
+
+
+class TestNormalizeAudio:
+    """Test suite for _normalize_audio and the noise gate."""
+
+    def test_quiet_audio_is_boosted_to_target(self, listener):
+        """Test that the peak is scaled to the target level."""
+        result = np.frombuffer(listener._normalize_audio(_pcm([0, 1000, -5000])), dtype=np.int16)
+
+        assert abs(int(np.abs(result).max()) - int(32767 * 0.8)) <= 1
+
+    def test_gain_is_capped(self, listener):
+        """Test that very quiet audio gets at most 10x gain."""
+        result = np.frombuffer(listener._normalize_audio(_pcm([10, -5])), dtype=np.int16)
+
+        assert result.tolist() == [100, -50]
+
+    def test_loud_and_silent_audio_are_unchanged(self, listener):
+        """Test that audio already at level, or all zeros, is returned as-is."""
+        loud = _pcm([30000, -32768])
+        silent = _pcm([0, 0])
+
+        assert listener._normalize_audio(loud) is loud
+        assert listener._normalize_audio(silent) is silent
+
+
+
+class TestRecording:
+    """Test suite for _record_with_silence_detection with a fake microphone."""
+
+    def test_records_pre_roll_and_voice_until_silence(self, monkeypatch, fake_pyaudio):
+        """Test that buffered pre-roll precedes the voiced chunks in the recording."""
+        monkeypatch.setenv("LOCAL_WHISPER_DEVICE", "cpu")
+        listener = VoiceListener(
+            controller=None,
+            chunk_size=4,
+            min_voice_duration_secs=0.0,
+            silence_duration_secs=0.1,
+            pre_roll_secs=8 / 16000,
+            noise_gate_enabled=False,
+        )
+        monkeypatch.setattr(listener, "_resolve_microphone_device_index", lambda: None)
+        quiet = [_pcm([1, 2, 3, 4]), _pcm([5, 6, 7, 8]), _pcm([9, 10, 11, 12])]
+        loud = [_pcm([20000] * 4), _pcm([-20000] * 4)]
+        fake_pyaudio.chunks.extend(quiet + loud)
+
+        audio, sample_rate, duration = asyncio.run(listener._record_with_silence_detection())
+
+        assert sample_rate == 16000
+        assert bytes(audio).startswith(b"".join(quiet[1:] + loud))
+        assert duration == len(audio) / (2 * sample_rate)
+        assert fake_pyaudio.streams[0].closed
+
+    def test_noise_gate_attenuates_quiet_chunks(self, monkeypatch, fake_pyaudio):
+        """Test that chunks under the gate threshold are scaled before buffering."""
+        monkeypatch.setenv("LOCAL_WHISPER_DEVICE", "cpu")
+        listener = VoiceListener(
+            controller=None,
+            chunk_size=2,
+            min_voice_duration_secs=0.0,
+            silence_duration_secs=0.1,
+            pre_roll_secs=2 / 16000,
+            noise_gate_threshold=0.01,
+            noise_gate_attenuation=0.2,
+        )
+        monkeypatch.setattr(listener, "_resolve_microphone_device_index", lambda: None)
+        fake_pyaudio.chunks.extend([_pcm([100, -100]), _pcm([20000, -20000])])
+
+        audio, _rate, _duration = asyncio.run(listener._record_with_silence_detection())
+
+        assert np.frombuffer(audio, dtype=np.int16)[:4].tolist() == [20, -20, 20000, -20000]
+
+    def test_level_callback_is_rate_limited(self, monkeypatch, fake_pyaudio):
+        """Test that level updates are throttled to the UI cadence."""
+        monkeypatch.setenv("LOCAL_WHISPER_DEVICE", "cpu")
+        levels = []
+        listener = VoiceListener(
+            controller=None,
+            chunk_size=4,
+            min_voice_duration_secs=0.0,
+            silence_duration_secs=0.2,
+            pre_roll_secs=0.0,
+            on_audio_level=levels.append,
+        )
+        monkeypatch.setattr(listener, "_resolve_microphone_device_index", lambda: None)
+        fake_pyaudio.chunks.append(_pcm([20000] * 4))
+
+        audio, _rate, _duration = asyncio.run(listener._record_with_silence_detection())
+
+        chunks_seen = len(audio) // 8
+        assert levels[0] == pytest.approx(20000 / 32768)
+        assert 1 <= len(levels) <= 10 < chunks_seen
+
+    def test_backlog_is_capped_at_max_duration(self, monkeypatch, fake_pyaudio):
+        """Test that chunks arriving faster than real time cannot overrun the buffer."""
+        monkeypatch.setenv("LOCAL_WHISPER_DEVICE", "cpu")
+        listener = VoiceListener(
+            controller=None,
+            chunk_size=1600,
+            min_voice_duration_secs=0.0,
+            max_record_duration_secs=0.5,
+            pre_roll_secs=0.0,
+            noise_gate_enabled=False,
+        )
+        monkeypatch.setattr(listener, "_resolve_microphone_device_index", lambda: None)
+        fake_pyaudio.chunks.extend([_pcm([20000] * 1600)] * 20)
+
+        audio, _rate, duration = asyncio.run(listener._record_with_silence_detection())
+
+        assert len(audio) == 1600 * 2 + 8000 * 2
+        assert duration == pytest.approx(0.6)
+
+    def test_timing_settings_become_chunk_counts(self, monkeypatch):
+        """Test that durations are converted to whole chunks once per sample rate."""
+        monkeypatch.setenv("LOCAL_WHISPER_DEVICE", "cpu")
+        listener = VoiceListener(
+            controller=None,
+            chunk_size=1600,
+            silence_duration_secs=0.25,
+            max_record_duration_secs=0.5,
+            min_voice_duration_secs=0.0,
+            pre_roll_secs=0.25,
+        )
+
+        listener._specialize_for_rate(16000)
+
+        assert listener._chunk_bytes == 3200
+        assert listener._pre_roll_frames == 2
+        assert listener._silence_frames_needed == 3
+        assert listener._max_frames == 5
+        assert listener._min_voice_frames == 0
+        assert listener._level_every == 1
+
+    def test_open_input_is_reused_across_recordings(self, monkeypatch, fake_pyaudio):
+        """Test that an already-open microphone serves consecutive utterances."""
+        monkeypatch.setenv("LOCAL_WHISPER_DEVICE", "cpu")
+        listener = VoiceListener(
+            controller=None,
+            chunk_size=4,
+            min_voice_duration_secs=0.0,
+            silence_duration_secs=0.1,
+            min_gap_secs=0.0,
+            pre_roll_secs=0.0,
+            noise_gate_enabled=False,
+        )
+        monkeypatch.setattr(listener, "_resolve_microphone_device_index", lambda: None)
+        loud = _pcm([20000] * 4)
+
+        async def record_twice():
+            listener._open_input()
+            try:
+                results = []
+                for _ in range(2):
+                    fake_pyaudio.chunks.append(loud)
+                    results.append(await listener._record_with_silence_detection())
+                return results
+            finally:
+                listener._close_input()
+
+        first, second = asyncio.run(record_twice())
+
+        assert bytes(first[0]).startswith(loud) and bytes(second[0]).startswith(loud)
+        assert len(fake_pyaudio.streams) == 1 and fake_pyaudio.streams[0].closed
+
+
+class TestWavBuffer:
+    """Test suite for _create_wav_buffer."""
+
+    def test_matches_wave_module_output(self, listener):
+        """Test that the packed header is byte-identical to the wave module's."""
+        audio = _pcm([1, -2, 3, -4, 5])
+        expected = io.BytesIO()
+        with wave.open(expected, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(16000)
+            wav_file.writeframes(audio)
+
+        assert listener._create_wav_buffer(audio, 16000).getvalue() == expected.getvalue()
+
+
+class TestTrimSilence:
+    """Test suite for _trim_silence."""
+
+    def test_cuts_edges_beyond_padding(self, listener):
+        """Test that silence further than the pad from voiced frames is dropped."""
+        # 100 Hz -> 2-sample frames and a 20-sample pad.
+        audio = np.zeros(200, dtype=np.int16)
+        audio[100:110] = 20000
+
+        trimmed = np.frombuffer(listener._trim_silence(audio.tobytes(), 100), dtype=np.int16)
+
+        np.testing.assert_array_equal(trimmed, audio[80:130])
+
+    def test_unvoiced_audio_is_left_alone(self, listener):
+        """Test that audio with no voiced frame is passed through unchanged."""
+        audio = _pcm([1, -1] * 50)
+
+        assert listener._trim_silence(audio, 100) is audio
+
+
+class _RecordingStt:
+    """Captures what the listener hands to speech-to-text."""
+
+    default_sample_rate = 16000
+
+    def __init__(self):
+        self.arrays = []
+        self.wavs = []
+
+    def warm_up(self):
+        pass
+
+    async def transcribe_audio_array(self, audio, sample_rate):
+        self.arrays.append((audio, sample_rate))
+        return " hello "
+
+    async def transcribe_wav_bytes(self, wav_bytes):
+        self.wavs.append(wav_bytes)
+        return "hello"
+
+
+class TestTranscribeSegment:
+    """Test suite for _transcribe_segment dispatch."""
+
+    def test_whisper_rate_audio_skips_wav(self, listener):
+        """Test that 16 kHz recordings go to Whisper as a float32 waveform."""
+        listener.stt = _RecordingStt()
+        finals = []
+        listener.on_final_transcript = finals.append
+
+        asyncio.run(listener._transcribe_segment(_pcm([30000, -16384]), 16000))
+
+        audio, sample_rate = listener.stt.arrays[0]
+        assert sample_rate == 16000 and audio.dtype == np.float32
+        np.testing.assert_allclose(audio, [30000 / 32768, -0.5])
+        assert listener.stt.wavs == [] and finals == ["hello"]
+
+    def test_quiet_waveform_is_normalized_in_float(self, listener):
+        """Test that the float path applies the same gain as _normalize_audio."""
+        listener.stt = _RecordingStt()
+        audio = _pcm([0, 1000, -5000])
+
+        asyncio.run(listener._transcribe_segment(audio, 16000))
+
+        expected = np.frombuffer(listener._normalize_audio(audio), dtype=np.int16) / 32768.0
+        np.testing.assert_allclose(listener.stt.arrays[0][0], expected, atol=1 / 32768)
+
+    def test_transcript_is_dispatched_before_logging(self, listener, monkeypatch):
+        """Test that the controller gets the command before the single log line."""
+        events = []
+        listener.stt = _RecordingStt()
+        listener._log_debug = False
+        listener.on_final_transcript = lambda text: events.append(("final", text))
+        monkeypatch.setattr(
+            "voice_module.voice_listener.tprint", lambda message: events.append(("log", message))
+        )
+
+        asyncio.run(listener._transcribe_segment(_pcm([30000, -16384]), 16000))
+
+        assert events == [("final", "hello"), ("log", "[VOICE] Transcript: hello")]
+
+    def test_other_rates_fall_back_to_wav(self, listener):
+        """Test that non-16 kHz recordings are still sent as WAV bytes."""
+        listener.stt = _RecordingStt()
+
+        asyncio.run(listener._transcribe_segment(_pcm([30000]), 44100))
+
+        assert listener.stt.arrays == [] and listener.stt.wavs[0].startswith(b"RIFF")
+
+
+class TestTranscribeWorker:
+    """Test suite for the recorder -> Whisper segment handoff."""
+
+    def test_drains_segments_in_order_until_sentinel(self, listener):
+        """Test that queued segments are transcribed FIFO and None stops the worker."""
+        listener.stt = _RecordingStt()
+        finals = []
+        listener.on_final_transcript = finals.append
+
+        async def _run():
+            pending = deque()
+            ready = asyncio.Event()
+            worker = asyncio.create_task(listener._transcribe_worker(pending, ready))
+            await asyncio.sleep(0)
+            pending.append((_pcm([12000, -12000] * 50), 16000, 0.1))
+            pending.append((_pcm([20000, -20000] * 50), 44100, 0.1))
+            ready.set()
+            await asyncio.sleep(0)
+            pending.append(None)
+            ready.set()
+            await asyncio.wait_for(worker, timeout=2)
+            return pending
+
+        assert not asyncio.run(_run())
+        assert len(listener.stt.arrays) == 1 and len(listener.stt.wavs) == 1
+        assert finals == ["hello", "hello"]
+
+
+class TestMicrophoneIndex:
+    """Test suite for the cached microphone device lookup."""
+
+    def test_settings_are_read_once_until_restart(self, listener, monkeypatch):
+        """Test that the device index is resolved once and refreshed by start()."""
+        reads = []
+        monkeypatch.setattr(
+            listener, "_resolve_microphone_device_index", lambda: reads.append(1) or 3
+        )
+
+        assert listener._microphone_index() == 3
+        assert listener._microphone_index() == 3
+        assert len(reads) == 1
+
+        listener._mic_index_resolved = False
+        listener._microphone_index()
+        assert len(reads) == 2
+
+
+class TestRunForever:
+    """Test suite for running the listener on the caller's event loop."""
+
+    def test_transcribes_until_stopped(self, monkeypatch, fake_pyaudio):
+        """Test that run_forever records on the current loop and exits on stop()."""
+        monkeypatch.setenv("LOCAL_WHISPER_DEVICE", "cpu")
+        finals = []
+        listener = VoiceListener(
+            controller=None,
+            chunk_size=160,
+            min_voice_duration_secs=0.0,
+            silence_duration_secs=0.1,
+            min_command_seconds=0.1,
+            pre_roll_secs=0.0,
+            on_final_transcript=finals.append,
+        )
+        listener.stt = _RecordingStt()
+        monkeypatch.setattr(listener, "_resolve_microphone_device_index", lambda: None)
+        fake_pyaudio.chunks.extend([_pcm([20000, -20000] * 80)] * 10)
+
+        async def _run():
+            task = asyncio.create_task(listener.run_forever())
+            for _ in range(200):
+                await asyncio.sleep(0.01)
+                if finals:
+                    break
+            assert listener.is_running()
+            listener.stop()
+            await asyncio.wait_for(task, timeout=2)
+
+        asyncio.run(_run())
+
+        assert finals == ["hello"]
+        assert not listener.is_running()
+        assert fake_pyaudio.streams[0].closed
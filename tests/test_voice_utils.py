@@ -0,0 +1,44 @@
+"""Tests for the voice text helpers."""
+
+import re
+
+import pytest
+
+from voice_module.voice_utils import env_positive_int, normalize_phrase
+
+
+class TestNormalizePhrase:
+    """Test suite for normalize_phrase."""
+
+    def test_lowercases_and_collapses_whitespace(self):
+        """Test that case is folded and inner whitespace runs become one space."""
+        assert normalize_phrase("  Open\tthe \n\n  BROWSER ") == "open the browser"
+
+    def test_blank_input(self):
+        """Test that whitespace-only input normalizes to an empty string."""
+        assert normalize_phrase(" \t\n") == ""
+
+    def test_matches_regex_normalization(self):
+        """Test that unicode whitespace is handled like the original \\s+ collapse."""
+        phrase = " Play  NEXT　track\x1c\r\n"
+
+        assert normalize_phrase(phrase) == re.sub(r"\s+", " ", phrase.strip().lower())
+
+
+class TestEnvPositiveInt:
+    """Test suite for env_positive_int."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"), [("3", 3), ("0", 1), ("-2", 1), ("two", 2), ("", 2)]
+    )
+    def test_value_is_validated(self, monkeypatch, raw, expected):
+        """Test that zero/negative values clamp to 1 and junk falls back to the default."""
+        monkeypatch.setenv("LOCAL_WHISPER_CONCURRENCY", raw)
+
+        assert env_positive_int("LOCAL_WHISPER_CONCURRENCY", 2) == expected
+
+    def test_unset_returns_default(self, monkeypatch):
+        """Test that an unset variable yields the default, even when it is 0."""
+        monkeypatch.delenv("LOCAL_WHISPER_CPU_THREADS", raising=False)
+
+        assert env_positive_int("LOCAL_WHISPER_CPU_THREADS", 0) == 0
@@ -1,17 +1,50 @@
 """Safe loading/saving helpers."""
 
 import json
+import os
+import threading
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+if orjson is not None:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers'
+    # existing except clauses keep working.
+    _loads = orjson.loads
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+else:
+    _loads = json.loads
+
+    def _dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
 
 def load_json(path: str | Path) -> dict:
     p = Path(path)
     if not p.exists():
         return {}
-    return json.loads(p.read_text())
+    return _loads(p.read_bytes())
+
 
+def save_json(path: str | Path, data: dict | list) -> None:
+    """Write ``data`` as JSON via a sibling temp file and an atomic rename.
 
-def save_json(path: str | Path, data: dict) -> None:
+    Readers never see a truncated file, and no fsync is issued, so the write
+    stays cheap on slow or network filesystems.
+    """
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(data, indent=2))
+    tmp = p.with_name(f".{p.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(_dumps(data))
+        os.replace(tmp, p)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
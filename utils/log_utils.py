@@ -3,26 +3,55 @@
 from __future__ import annotations
 
 import builtins
+import re
 import time
 from typing import Any
 
 
-_LEVELS = {"DEEP", "DEBUG", "INFO", "WARN", "ERROR"}
+_LEVEL_ORDER = {"DEEP": 0, "DEBUG": 1, "INFO": 2, "WARN": 3, "ERROR": 4}
+_LEVELS = set(_LEVEL_ORDER)
+_TAG_RE = re.compile(r"\s*\[([^\]]*)\]")
+_DEFAULT_LEVEL = _LEVEL_ORDER["INFO"]
+
+# Until settings are loaded nothing is filtered.
+_min_level = _LEVEL_ORDER["DEEP"]
+
+
+def set_log_level(level: str | None) -> None:
+    """Set the minimum level for messages that carry an explicit level tag."""
+    global _min_level
+    _min_level = _LEVEL_ORDER.get(str(level or "").strip().upper(), _DEFAULT_LEVEL)
+
+
+def current_level_int() -> int:
+    """Return the active minimum level (0=DEEP ... 4=ERROR)."""
+    return _min_level
+
+
+def _leading_level(message: str) -> int | None:
+    # Only the first tag is inspected so filtered messages skip full parsing.
+    text = message.lstrip()
+    if not text.startswith("["):
+        return None
+    end = text.find("]")
+    if end == -1:
+        return None
+    return _LEVEL_ORDER.get(text[1:end].strip().upper())
 
 
 def _split_tags(message: str) -> tuple[list[str], str]:
     tags: list[str] = []
-    remaining = message.lstrip()
-    while remaining.startswith("["):
-        end = remaining.find("]")
-        if end == -1:
+    pos = 0
+    while True:
+        match = _TAG_RE.match(message, pos)
+        if match is None:
             break
-        tag = remaining[1:end].strip()
+        tag = match.group(1).strip()
         if not tag:
             break
         tags.append(tag)
-        remaining = remaining[end + 1 :].lstrip()
-    return tags, remaining
+        pos = match.end()
+    return tags, message[pos:].lstrip()
 
 
 def _format_message(message: str) -> str:
@@ -48,15 +77,29 @@ def _format_message(message: str) -> str:
 
 
 def tprint(*args: Any, **kwargs: Any) -> None:
-    """Print with a timestamp prefix and normalized tag order."""
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    """Print with a timestamp prefix and normalized tag order.
+
+    Messages whose first tag is a level below the configured log level are
+    dropped before any formatting work.
+    """
     message = " ".join(str(arg) for arg in args)
+    level = _leading_level(message)
+    if level is not None and level < _min_level:
+        return
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     formatted = _format_message(message)
     builtins.print(f"[{timestamp}]{formatted}", **kwargs)
 
 
 def log(system: str, message: str, variant: str | None = None) -> None:
-    """Log with explicit system and optional variant."""
+    """Log with explicit system and optional variant.
+
+    As in tprint, only a variant that names a level is filtered; untagged
+    messages always pass.
+    """
+    level = _LEVEL_ORDER.get((variant or "").strip().upper())
+    if level is not None and level < _min_level:
+        return
     if variant:
         tprint(f"[{system}][{variant}] {message}")
     else:
@@ -3,40 +3,47 @@
 from __future__ import annotations
 
 import threading
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from utils.file_utils import load_json
-from utils.log_utils import tprint
+from utils.log_utils import set_log_level, tprint
 
+# Writers serialize on the lock and publish a new read-only snapshot; readers
+# just load the module-level reference (an atomic operation) without locking.
 _lock = threading.Lock()
-_settings_cache: dict[str, Any] = {}
+_snapshot: Mapping[str, Any] | None = None
+_deep_logging = False
 
 
-def refresh_settings() -> dict[str, Any]:
-    """Reload settings from disk and replace the cache."""
+def refresh_settings() -> Mapping[str, Any]:
+    """Reload settings from disk and publish a new read-only snapshot."""
+    global _snapshot, _deep_logging
     data = load_json("config/app_settings.json")
     if not isinstance(data, dict):
         data = {}
+    snapshot = MappingProxyType(dict(data))
+    level = str(snapshot.get("log_level", "")).upper()
     with _lock:
-        _settings_cache.clear()
-        _settings_cache.update(data)
-        return dict(_settings_cache)
+        _deep_logging = level == "DEEP"
+        set_log_level(level)
+        _snapshot = snapshot
+    return snapshot
 
 
-def get_settings() -> dict[str, Any]:
-    """Return a copy of the cached settings."""
-    with _lock:
-        if _settings_cache:
-            return dict(_settings_cache)
-    refresh_settings()
-    with _lock:
-        return dict(_settings_cache)
+def get_settings() -> Mapping[str, Any]:
+    """Return the current read-only settings snapshot."""
+    snapshot = _snapshot
+    if snapshot is None:
+        snapshot = refresh_settings()
+    return snapshot
 
 
 def is_deep_logging() -> bool:
     """Return True when log_level requests deep tracing."""
-    level = str(get_settings().get("log_level", "")).upper()
-    return level in {"DEEP"}
+    if _snapshot is None:
+        refresh_settings()
+    return _deep_logging
 
 
 def deep_log(message: str) -> None:
@@ -2,18 +2,21 @@
 
 import platform
 
+# The host OS cannot change while the process runs; resolve it once.
+_CURRENT_OS = platform.system().lower()
+
 
 def current_os() -> str:
-    return platform.system().lower()
+    return _CURRENT_OS
 
 
 def is_macos() -> bool:
-    return current_os() == "darwin"
+    return _CURRENT_OS == "darwin"
 
 
 def is_windows() -> bool:
-    return current_os().startswith("windows")
+    return _CURRENT_OS.startswith("windows")
 
 
 def is_linux() -> bool:
-    return current_os() == "linux"
+    return _CURRENT_OS == "linux"
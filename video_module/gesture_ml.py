@@ -2,22 +2,46 @@
 
 from __future__ import annotations
 
+import atexit
 import csv
 import json
 import os
+import shutil
 import sys
+import weakref
 from pathlib import Path
 from typing import Sequence
+
+import numpy as np
+
 from video_module.tflite_pipeline import (
     POINT_HISTORY_LEN,
     calc_landmark_list,
-    pre_process_landmark,
+    landmarks_to_features,
     pre_process_point_history,
 )
+from utils.file_utils import load_json, save_json
 from utils.log_utils import tprint
 from utils.settings_store import deep_log, is_deep_logging
 
 
+# Staged sample rows per CSV before they are appended to disk automatically.
+SAMPLE_FLUSH_ROWS = 64
+
+_live_datasets: "weakref.WeakSet[GestureDataset]" = weakref.WeakSet()
+
+
+def _flush_live_datasets() -> None:
+    for dataset in list(_live_datasets):
+        try:
+            dataset.flush()
+        except Exception:
+            pass
+
+
+atexit.register(_flush_live_datasets)
+
+
 def _default_user_data_dir() -> Path:
     data_dir = os.getenv("USER_DATA_DIR") or os.getenv("DATA_DIR")
     if data_dir:
@@ -47,6 +71,12 @@ def _read_label_csv(path: Path) -> list[str]:
     return labels
 
 
+def _feature_row(label_id: int, feature_list: Sequence[float]) -> list[str | int]:
+    # Features are ratios of pixel offsets fed to float32 models; six significant
+    # digits is finer than a one-pixel step and keeps rows compact.
+    return [label_id, *(format(float(value), ".6g") for value in feature_list)]
+
+
 def _write_label_csv(path: Path, labels: Sequence[str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", newline="", encoding="utf-8") as fh:
@@ -86,7 +116,17 @@ class GestureDataset:
         self.command_steps: dict[str, list[dict]] = {}
         self.command_metadata: dict[str, dict] = {}
         self.enabled: set[str] = set()
+        # Sample rows are staged per CSV and written in one append by flush_samples().
+        self._pending_rows: dict[Path, list[list[str | int]]] = {}
+        # Parsed label CSVs keyed by path, tagged with (mtime_ns, size) so edits
+        # made by another GestureDataset instance are still picked up.
+        self._label_cache: dict[Path, tuple[tuple[int, int] | None, list[str]]] = {}
+        # Metadata attributes (hotkeys, commands, ...) changed since the last write.
+        # Inside a ``with dataset:`` block writes are deferred to the block's exit.
+        self._dirty: set[str] = set()
+        self._batch_depth = 0
         self._load_metadata()
+        _live_datasets.add(self)
 
     def _ensure_base_dir_writable(self) -> None:
         try:
@@ -104,27 +144,27 @@ class GestureDataset:
     def _load_metadata(self) -> None:
         if self.hotkeys_path.exists():
             try:
-                self.hotkeys = json.loads(self.hotkeys_path.read_text())
+                self.hotkeys = load_json(self.hotkeys_path)
             except json.JSONDecodeError:
                 self.hotkeys = {}
         if self.commands_path.exists():
             try:
-                self.commands = json.loads(self.commands_path.read_text())
+                self.commands = load_json(self.commands_path)
             except json.JSONDecodeError:
                 self.commands = {}
         if self.command_steps_path.exists():
             try:
-                self.command_steps = json.loads(self.command_steps_path.read_text())
+                self.command_steps = load_json(self.command_steps_path)
             except json.JSONDecodeError:
                 self.command_steps = {}
         if self.command_metadata_path.exists():
             try:
-                self.command_metadata = json.loads(self.command_metadata_path.read_text())
+                self.command_metadata = load_json(self.command_metadata_path)
             except json.JSONDecodeError:
                 self.command_metadata = {}
         if self.enabled_path.exists():
             try:
-                items = json.loads(self.enabled_path.read_text())
+                items = load_json(self.enabled_path)
                 self.enabled = {str(lbl) for lbl in items}
             except json.JSONDecodeError:
                 self.enabled = set()
@@ -147,61 +187,94 @@ class GestureDataset:
                 f"keypoint_labels={presets_labels.exists()}"
             )
             return False
-        if not self.keypoint_csv.exists():
-            self.keypoint_dir.mkdir(parents=True, exist_ok=True)
-            self.keypoint_csv.write_text(presets_csv.read_text())
-        if not self.keypoint_labels_path.exists():
-            self.keypoint_labels_path.write_text(presets_labels.read_text())
-        if point_labels.exists() and not self.point_history_labels_path.exists():
-            self.point_history_labels_path.parent.mkdir(parents=True, exist_ok=True)
-            self.point_history_labels_path.write_text(point_labels.read_text())
-        if keypoint_model.exists() and not self.keypoint_model_path.exists():
-            self.keypoint_model_path.parent.mkdir(parents=True, exist_ok=True)
-            self.keypoint_model_path.write_bytes(keypoint_model.read_bytes())
-        if point_model.exists() and not self.point_history_model_path.exists():
-            self.point_history_model_path.parent.mkdir(parents=True, exist_ok=True)
-            self.point_history_model_path.write_bytes(point_model.read_bytes())
+        copies = [
+            (presets_csv, self.keypoint_csv),
+            (presets_labels, self.keypoint_labels_path),
+            (point_labels, self.point_history_labels_path),
+            (keypoint_model, self.keypoint_model_path),
+            (point_model, self.point_history_model_path),
+        ]
+        for src, dst in copies:
+            if dst.exists() or not src.exists():
+                continue
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            # copyfile uses the kernel's zero-copy path (sendfile/fcopyfile).
+            shutil.copyfile(src, dst)
         if not self.enabled_path.exists():
             labels = set(self.keypoint_labels()) | set(self.point_history_labels())
             if labels:
                 self.enabled = set(labels)
-                self.enabled_path.write_text(json.dumps(sorted(self.enabled), indent=2))
+                self._mark_dirty("enabled")
         return True
 
     def keypoint_labels(self) -> list[str]:
-        return _read_label_csv(self.keypoint_labels_path)
+        return list(self._labels(self.keypoint_labels_path))
 
     def point_history_labels(self) -> list[str]:
-        return _read_label_csv(self.point_history_labels_path)
+        return list(self._labels(self.point_history_labels_path))
+
+    @staticmethod
+    def _label_stamp(path: Path) -> tuple[int, int] | None:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _labels(self, path: Path) -> list[str]:
+        """Return the cached labels for ``path``; callers must not mutate it."""
+        stamp = self._label_stamp(path)
+        cached = self._label_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        labels = _read_label_csv(path)
+        self._label_cache[path] = (stamp, labels)
+        return labels
+
+    def _write_labels(self, path: Path, labels: list[str]) -> None:
+        _write_label_csv(path, labels)
+        self._label_cache[path] = (self._label_stamp(path), labels)
 
     def _ensure_label(self, label: str, *, kind: str) -> int:
         if kind == "keypoint":
-            labels = self.keypoint_labels()
             path = self.keypoint_labels_path
         elif kind == "point_history":
-            labels = self.point_history_labels()
             path = self.point_history_labels_path
         else:
             raise ValueError(f"Unknown label kind: {kind}")
 
+        labels = self._labels(path)
         if label not in labels:
-            labels.append(label)
-            _write_label_csv(path, labels)
+            labels = [*labels, label]
+            self._write_labels(path, labels)
         return labels.index(label)
 
     def append_keypoint_sample(self, label: str, feature_list: Sequence[float]) -> None:
         label_id = self._ensure_label(label, kind="keypoint")
-        self.keypoint_dir.mkdir(parents=True, exist_ok=True)
-        with self.keypoint_csv.open("a", newline="", encoding="utf-8") as fh:
-            writer = csv.writer(fh)
-            writer.writerow([label_id, *feature_list])
+        self._stage_row(self.keypoint_csv, _feature_row(label_id, feature_list))
 
     def append_point_history_sample(self, label: str, feature_list: Sequence[float]) -> None:
         label_id = self._ensure_label(label, kind="point_history")
-        self.point_history_dir.mkdir(parents=True, exist_ok=True)
-        with self.point_history_csv.open("a", newline="", encoding="utf-8") as fh:
-            writer = csv.writer(fh)
-            writer.writerow([label_id, *feature_list])
+        self._stage_row(self.point_history_csv, _feature_row(label_id, feature_list))
+
+    def _stage_row(self, path: Path, row: list[str | int]) -> None:
+        rows = self._pending_rows.setdefault(path, [])
+        rows.append(row)
+        if len(rows) >= SAMPLE_FLUSH_ROWS:
+            self._append_rows(path, self._pending_rows.pop(path))
+
+    @staticmethod
+    def _append_rows(path: Path, rows: list[list[str | int]]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", newline="", encoding="utf-8") as fh:
+            csv.writer(fh).writerows(rows)
+
+    def flush_samples(self) -> None:
+        """Append staged sample rows to their CSVs, one open per file."""
+        pending, self._pending_rows = self._pending_rows, {}
+        for path, rows in pending.items():
+            if rows:
+                self._append_rows(path, rows)
 
     def list_gestures(self) -> list[dict]:
         labels = sorted(set(self.keypoint_labels()) | set(self.point_history_labels()))
@@ -220,21 +293,21 @@ class GestureDataset:
             self.hotkeys[label] = hotkey
         else:
             self.hotkeys.pop(label, None)
-        self.hotkeys_path.write_text(json.dumps(self.hotkeys, indent=2))
+        self._mark_dirty("hotkeys")
 
     def set_command(self, label: str, command: str | None) -> None:
         if command:
             self.commands[label] = command
         else:
             self.commands.pop(label, None)
-        self.commands_path.write_text(json.dumps(self.commands, indent=2))
+        self._mark_dirty("commands")
 
     def set_command_steps(self, label: str, steps: list[dict] | None) -> None:
         if steps:
             self.command_steps[label] = steps
         else:
             self.command_steps.pop(label, None)
-        self.command_steps_path.write_text(json.dumps(self.command_steps, indent=2))
+        self._mark_dirty("command_steps")
 
     def get_command_metadata(self, label: str) -> dict | None:
         metadata = self.command_metadata.get(label)
@@ -247,64 +320,127 @@ class GestureDataset:
             self.command_metadata[label] = metadata
         else:
             self.command_metadata.pop(label, None)
-        self.command_metadata_path.write_text(json.dumps(self.command_metadata, indent=2))
+        self._mark_dirty("command_metadata")
 
     def set_enabled(self, label: str, enabled: bool) -> None:
         if enabled:
             self.enabled.add(label)
         else:
             self.enabled.discard(label)
-        self.enabled_path.write_text(json.dumps(sorted(self.enabled), indent=2))
+        self._mark_dirty("enabled")
+
+    def _mark_dirty(self, name: str) -> None:
+        self._dirty.add(name)
+        if not self._batch_depth:
+            self.flush_metadata()
+
+    def flush_metadata(self) -> None:
+        """Write each metadata JSON file that changed since the last flush."""
+        dirty, self._dirty = self._dirty, set()
+        for name in sorted(dirty):
+            value = getattr(self, name)
+            if isinstance(value, set):
+                value = sorted(value)
+            save_json(getattr(self, f"{name}_path"), value)
+
+    def flush(self) -> None:
+        self.flush_samples()
+        self.flush_metadata()
+
+    def __enter__(self) -> "GestureDataset":
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
 
     def is_enabled(self, label: str) -> bool:
         return label in self.enabled
 
     def remove_label(self, label: str) -> None:
+        self.flush_samples()
         self._remove_label_from_csv(self.keypoint_csv, self.keypoint_labels_path, label)
         self._remove_label_from_csv(
             self.point_history_csv, self.point_history_labels_path, label
         )
-        self.hotkeys.pop(label, None)
-        self.commands.pop(label, None)
-        self.command_steps.pop(label, None)
-        self.command_metadata.pop(label, None)
-        self.enabled.discard(label)
-        self.hotkeys_path.write_text(json.dumps(self.hotkeys, indent=2))
-        self.commands_path.write_text(json.dumps(self.commands, indent=2))
-        self.command_steps_path.write_text(json.dumps(self.command_steps, indent=2))
-        self.command_metadata_path.write_text(json.dumps(self.command_metadata, indent=2))
-        self.enabled_path.write_text(json.dumps(sorted(self.enabled), indent=2))
+        with self:
+            for name in ("hotkeys", "commands", "command_steps", "command_metadata"):
+                if getattr(self, name).pop(label, None) is not None:
+                    self._mark_dirty(name)
+            if label in self.enabled:
+                self.enabled.discard(label)
+                self._mark_dirty("enabled")
 
     def _remove_label_from_csv(
         self, data_path: Path, labels_path: Path, label: str
     ) -> None:
-        labels = _read_label_csv(labels_path)
+        labels = list(self._labels(labels_path))
         if label not in labels:
             return
         label_idx = labels.index(label)
         labels.pop(label_idx)
-        _write_label_csv(labels_path, labels)
+        self._write_labels(labels_path, labels)
 
         if not data_path.exists():
             return
-        rows: list[list[str]] = []
-        with data_path.open(encoding="utf-8") as fh:
-            for row in csv.reader(fh):
-                if not row:
-                    continue
-                try:
-                    idx = int(row[0])
-                except ValueError:
-                    continue
-                if idx == label_idx:
-                    continue
-                if idx > label_idx:
-                    row[0] = str(idx - 1)
-                rows.append(row)
-        data_path.parent.mkdir(parents=True, exist_ok=True)
-        with data_path.open("w", newline="", encoding="utf-8") as fh:
-            writer = csv.writer(fh)
-            writer.writerows(rows)
+        # Stream line by line: only the leading label id needs re-indexing, so the
+        # feature columns are copied through as raw bytes without CSV parsing.
+        tmp_path = data_path.with_name(f".{data_path.name}.tmp")
+        try:
+            with data_path.open("rb") as src, tmp_path.open("wb") as dst:
+                for line in src:
+                    if not line.strip():
+                        continue
+                    comma = line.find(b",")
+                    head = line[:comma] if comma >= 0 else line.rstrip(b"\r\n")
+                    try:
+                        idx = int(head)
+                    except ValueError:
+                        continue
+                    if idx == label_idx:
+                        continue
+                    if idx > label_idx:
+                        line = str(idx - 1).encode() + line[len(head) :]
+                    if not line.endswith(b"\n"):
+                        line += b"\r\n"
+                    dst.write(line)
+            os.replace(tmp_path, data_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+
+class _StatusOverlay:
+    """Rasterizes a status line once and blits it until the text changes."""
+
+    def __init__(self, cv2, *, origin: tuple[int, int] = (10, 30), scale: float = 0.7) -> None:
+        self._cv2 = cv2
+        self._origin = origin
+        self._scale = scale
+        self._key: tuple | None = None
+        self._canvas: np.ndarray | None = None
+        self._mask: np.ndarray | None = None
+
+    def _render(self, text: str, color: tuple[int, int, int]) -> None:
+        cv2 = self._cv2
+        (width, height), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, self._scale, 2)
+        x, y = self._origin
+        canvas = np.zeros((y + baseline + 2, x + width + 2, 3), dtype=np.uint8)
+        cv2.putText(canvas, text, (x, y), cv2.FONT_HERSHEY_SIMPLEX, self._scale, color, 2)
+        self._canvas = canvas
+        self._mask = canvas.any(axis=2)
+
+    def draw(self, frame: np.ndarray, text: str, color: tuple[int, int, int]) -> None:
+        key = (text, color)
+        if key != self._key:
+            self._render(text, color)
+            self._key = key
+        rows = min(self._canvas.shape[0], frame.shape[0])
+        cols = min(self._canvas.shape[1], frame.shape[1])
+        mask = self._mask[:rows, :cols]
+        frame[:rows, :cols][mask] = self._canvas[:rows, :cols][mask]
 
 
 class GestureCollector:
@@ -316,6 +452,7 @@ class GestureCollector:
         device_index: int = 0,
         detection_confidence: float = 0.7,
         tracking_confidence: float = 0.5,
+        model_complexity: int = 1,
         show_preview: bool = False,
     ) -> None:
         self.show_preview = show_preview
@@ -331,39 +468,59 @@ class GestureCollector:
             raise RuntimeError(
                 "MediaPipe is missing 'solutions'. Install mediapipe>=0.10 in the active interpreter."
             )
-        from video_module.video_stream import VideoStream
+        from video_module.video_stream import FrameGrabber, VideoStream
 
         self._cv2 = cv2
         self._hand_connections = mp_solutions.hands.HAND_CONNECTIONS
         self.stream = VideoStream(device_index)
+        self._grabber = FrameGrabber(self.stream)
         self._hands = mp_solutions.hands.Hands(
             static_image_mode=False,
             max_num_hands=1,
             min_detection_confidence=detection_confidence,
             min_tracking_confidence=tracking_confidence,
+            model_complexity=model_complexity,
         )
         self._drawer = mp_solutions.drawing_utils
+        self._rgb: np.ndarray | None = None
+        self._status = _StatusOverlay(cv2)
+
+    def _process(self, frame):
+        """Run MediaPipe Hands on a BGR frame via a reused RGB buffer."""
+        if self._rgb is None or self._rgb.shape != frame.shape:
+            self._rgb = np.empty_like(frame)
+        self._rgb.flags.writeable = True
+        self._cv2.cvtColor(frame, self._cv2.COLOR_BGR2RGB, dst=self._rgb)
+        # A read-only image lets MediaPipe skip its defensive copy.
+        self._rgb.flags.writeable = False
+        return self._hands.process(self._rgb)
+
+    def _open_capture(self) -> None:
+        self.stream.open()
+        # Frames are read on a worker thread; preview windows stay on this one.
+        self._grabber.start()
+
+    def _close_capture(self) -> None:
+        self._grabber.stop()
+        self.stream.close()
 
     def collect_static(
         self, dataset: GestureDataset, label: str, target_frames: int = 60
     ) -> int:
         collected = 0
-        self.stream.open()
+        self._open_capture()
         tprint(f"[COLLECT] Static gesture='{label}' target_frames={target_frames}")
         try:
             while collected < target_frames:
-                ok, frame = self.stream.read()
+                ok, frame = self._grabber.read()
                 if not ok or frame is None:
                     tprint("[COLLECT] Camera read failed")
                     break
                 frame = self._cv2.flip(frame, 1)
-                results = self._hands.process(
-                    self._cv2.cvtColor(frame, self._cv2.COLOR_BGR2RGB)
-                )
+                results = self._process(frame)
                 if results.multi_hand_landmarks:
                     hand_landmarks = results.multi_hand_landmarks[0]
-                    landmark_list = calc_landmark_list(frame, hand_landmarks)
-                    features = pre_process_landmark(landmark_list)
+                    features = landmarks_to_features(frame, hand_landmarks)
                     dataset.append_keypoint_sample(label, features)
                     collected += 1
                     self._drawer.draw_landmarks(
@@ -372,20 +529,15 @@ class GestureCollector:
                         self._hand_connections,
                     )
                 if self.show_preview:
-                    self._cv2.putText(
-                        frame,
-                        f"{label} frames: {collected}/{target_frames}",
-                        (10, 30),
-                        self._cv2.FONT_HERSHEY_SIMPLEX,
-                        0.7,
-                        (0, 255, 0),
-                        2,
+                    self._status.draw(
+                        frame, f"{label} frames: {collected}/{target_frames}", (0, 255, 0)
                     )
                     self._cv2.imshow("Collect Static Gesture", frame)
                     if (self._cv2.waitKey(1) & 0xFF) == ord("q"):
                         break
         finally:
-            self.stream.close()
+            dataset.flush_samples()
+            self._close_capture()
             if self.show_preview:
                 self._cv2.destroyAllWindows()
         return collected
@@ -399,40 +551,36 @@ class GestureCollector:
         show_preview: bool | None = None,
     ) -> int:
         collected = 0
-        self.stream.open()
+        self._open_capture()
         tprint(f"[COLLECT] Dynamic gesture='{label}' repetitions={repetitions}")
         if show_preview is None:
             show_preview = self.show_preview
         try:
+            point_history = np.zeros((POINT_HISTORY_LEN, 2), dtype=np.int32)
             for rep in range(repetitions):
-                point_history: list[list[int]] = []
-                while len(point_history) < POINT_HISTORY_LEN:
-                    ok, frame = self.stream.read()
+                filled = 0
+                while filled < POINT_HISTORY_LEN:
+                    ok, frame = self._grabber.read()
                     if not ok or frame is None:
                         tprint("[COLLECT] Camera read failed")
                         return collected
                     frame = self._cv2.flip(frame, 1)
-                    results = self._hands.process(
-                        self._cv2.cvtColor(frame, self._cv2.COLOR_BGR2RGB)
-                    )
+                    results = self._process(frame)
                     if results.multi_hand_landmarks:
                         hand_landmarks = results.multi_hand_landmarks[0]
                         landmark_list = calc_landmark_list(frame, hand_landmarks)
-                        point_history.append(landmark_list[8])
+                        point_history[filled] = landmark_list[8]
+                        filled += 1
                         self._drawer.draw_landmarks(
                             frame,
                             hand_landmarks,
                             self._hand_connections,
                         )
                     if show_preview:
-                        self._cv2.putText(
+                        self._status.draw(
                             frame,
-                            f"{label} rep {rep+1}/{repetitions} {len(point_history)}/{POINT_HISTORY_LEN}",
-                            (10, 30),
-                            self._cv2.FONT_HERSHEY_SIMPLEX,
-                            0.7,
+                            f"{label} rep {rep+1}/{repetitions} {filled}/{POINT_HISTORY_LEN}",
                             (255, 255, 0),
-                            2,
                         )
                         self._cv2.imshow("Collect Dynamic Gesture", frame)
                         if (self._cv2.waitKey(1) & 0xFF) == ord("q"):
@@ -442,7 +590,8 @@ class GestureCollector:
                 dataset.append_point_history_sample(label, features)
                 collected += 1
         finally:
-            self.stream.close()
+            dataset.flush_samples()
+            self._close_capture()
             if show_preview:
                 self._cv2.destroyAllWindows()
         return collected
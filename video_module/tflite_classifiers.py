@@ -21,25 +21,41 @@ def _load_interpreter(model_path: Path):
     return Interpreter(model_path=str(model_path))
 
 
-class KeyPointClassifier:
+class _TFLiteClassifier:
+    """Shared interpreter plumbing for single-frame inference."""
+
     def __init__(self, model_path: Path) -> None:
-        if not model_path.exists():
-            raise FileNotFoundError(f"Missing keypoint model: {model_path}")
         self._interpreter = _load_interpreter(model_path)
         self._interpreter.allocate_tensors()
         self._input_details = self._interpreter.get_input_details()
         self._output_details = self._interpreter.get_output_details()
+        self._input_index = self._input_details[0]["index"]
+        self._output_index = self._output_details[0]["index"]
+        # Accessors for numpy views onto the interpreter's own tensor memory.
+        self._input_tensor = self._interpreter.tensor(self._input_index)
+        self._output_tensor = self._interpreter.tensor(self._output_index)
 
-    def __call__(self, landmark_list: Sequence[float]) -> tuple[int, float]:
-        input_data = np.array([landmark_list], dtype=np.float32)
-        self._interpreter.set_tensor(self._input_details[0]["index"], input_data)
+    def _predict_one(self, features) -> tuple[int, float]:
+        # Write straight into the input tensor and read the output in place,
+        # skipping set_tensor/get_tensor copies. No view may outlive invoke().
+        self._input_tensor()[0] = features
         self._interpreter.invoke()
-        output = self._interpreter.get_tensor(self._output_details[0]["index"])[0]
+        output = self._output_tensor()[0]
         idx = int(np.argmax(output))
         return idx, float(output[idx])
 
 
-class PointHistoryClassifier:
+class KeyPointClassifier(_TFLiteClassifier):
+    def __init__(self, model_path: Path) -> None:
+        if not model_path.exists():
+            raise FileNotFoundError(f"Missing keypoint model: {model_path}")
+        super().__init__(model_path)
+
+    def __call__(self, landmark_list: Sequence[float] | np.ndarray) -> tuple[int, float]:
+        return self._predict_one(landmark_list)
+
+
+class PointHistoryClassifier(_TFLiteClassifier):
     def __init__(
         self,
         model_path: Path,
@@ -49,20 +65,12 @@ class PointHistoryClassifier:
     ) -> None:
         if not model_path.exists():
             raise FileNotFoundError(f"Missing point history model: {model_path}")
-        self._interpreter = _load_interpreter(model_path)
-        self._interpreter.allocate_tensors()
-        self._input_details = self._interpreter.get_input_details()
-        self._output_details = self._interpreter.get_output_details()
+        super().__init__(model_path)
         self._score_threshold = score_threshold
         self._invalid_value = invalid_value
 
-    def __call__(self, point_history_list: Sequence[float]) -> tuple[int, float]:
-        input_data = np.array([point_history_list], dtype=np.float32)
-        self._interpreter.set_tensor(self._input_details[0]["index"], input_data)
-        self._interpreter.invoke()
-        output = self._interpreter.get_tensor(self._output_details[0]["index"])[0]
-        idx = int(np.argmax(output))
-        score = float(output[idx])
+    def __call__(self, point_history_list: Sequence[float] | np.ndarray) -> tuple[int, float]:
+        idx, score = self._predict_one(point_history_list)
         if score < self._score_threshold:
             return self._invalid_value, score
         return idx, score
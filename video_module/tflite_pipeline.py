@@ -2,64 +2,212 @@
 
 from __future__ import annotations
 
-import copy
-import itertools
-from collections import deque
+import threading
 from typing import Sequence
 
-POINT_HISTORY_LEN = 16
+import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional accelerator
+    njit = None
 
-def calc_landmark_list(image, landmarks) -> list[list[int]]:
-    image_width, image_height = image.shape[1], image.shape[0]
-    landmark_point: list[list[int]] = []
-    for _, landmark in enumerate(landmarks.landmark):
-        landmark_x = min(int(landmark.x * image_width), image_width - 1)
-        landmark_y = min(int(landmark.y * image_height), image_height - 1)
-        landmark_point.append([landmark_x, landmark_y])
-    return landmark_point
-
-
-def pre_process_landmark(landmark_list: Sequence[Sequence[int]]) -> list[float]:
-    temp_landmark_list = copy.deepcopy(landmark_list)
-    base_x, base_y = 0, 0
-    for index, landmark_point in enumerate(temp_landmark_list):
-        if index == 0:
-            base_x, base_y = landmark_point[0], landmark_point[1]
-        temp_landmark_list[index][0] = temp_landmark_list[index][0] - base_x
-        temp_landmark_list[index][1] = temp_landmark_list[index][1] - base_y
-
-    temp_landmark_list = list(itertools.chain.from_iterable(temp_landmark_list))
-    max_value = max(list(map(abs, temp_landmark_list))) if temp_landmark_list else 1
+POINT_HISTORY_LEN = 16
+LANDMARK_COUNT = 21
+
+# Per-thread scratch space so the collector and recognizer threads never share
+# a buffer while normalizing landmarks.
+_scratch = threading.local()
+
+
+def _landmark_buffer(rows: int) -> np.ndarray:
+    buf = getattr(_scratch, "landmarks", None)
+    if buf is None or buf.shape[0] < rows:
+        buf = np.empty((max(rows, LANDMARK_COUNT), 2), dtype=np.float32)
+        _scratch.landmarks = buf
+    return buf[:rows]
+
+
+def _normalize_landmarks_loop(coords: np.ndarray) -> None:
+    # Single fused pass: translate to the wrist while tracking max |value|,
+    # then scale by its inverse. Written as plain loops so Numba can compile it.
+    base_x = coords[0, 0]
+    base_y = coords[0, 1]
+    max_value = 0.0
+    for i in range(coords.shape[0]):
+        x = coords[i, 0] - base_x
+        y = coords[i, 1] - base_y
+        coords[i, 0] = x
+        coords[i, 1] = y
+        max_value = max(max_value, abs(x), abs(y))
+    if max_value == 0.0:
+        max_value = 1.0
+    inv = 1.0 / max_value
+    for i in range(coords.shape[0]):
+        coords[i, 0] *= inv
+        coords[i, 1] *= inv
+
+
+def _normalize_landmarks_numpy(coords: np.ndarray) -> None:
+    coords -= coords[0].copy()
+    max_value = float(np.abs(coords).max())
     if max_value == 0:
-        max_value = 1
-    return [value / max_value for value in temp_landmark_list]
-
-
-def pre_process_point_history(image, point_history: Sequence[Sequence[int]]) -> list[float]:
+        max_value = 1.0
+    coords *= 1.0 / max_value
+
+
+def _offset_point_history_loop(
+    points: np.ndarray, out: np.ndarray, scale_x: float, scale_y: float
+) -> None:
+    # Offsets from the first point, scaled by 1/frame size, written into ``out``.
+    base_x = points[0, 0]
+    base_y = points[0, 1]
+    for i in range(points.shape[0]):
+        out[i, 0] = (points[i, 0] - base_x) * scale_x
+        out[i, 1] = (points[i, 1] - base_y) * scale_y
+
+
+def _offset_point_history_numpy(
+    points: np.ndarray, out: np.ndarray, scale_x: float, scale_y: float
+) -> None:
+    np.subtract(points, points[0], out=out, casting="unsafe")
+    out *= (scale_x, scale_y)
+
+
+if njit is not None:
+    _normalize_landmarks = njit(cache=True)(_normalize_landmarks_loop)
+    _offset_point_history = njit(cache=True)(_offset_point_history_loop)
+    # Compile at import so the first camera frame does not pay the JIT cost.
+    _normalize_landmarks(np.ones((LANDMARK_COUNT, 2), dtype=np.float32))
+    _offset_point_history(
+        np.ones((POINT_HISTORY_LEN, 2), dtype=np.int32),
+        np.empty((POINT_HISTORY_LEN, 2), dtype=np.float32),
+        1.0,
+        1.0,
+    )
+else:
+    _normalize_landmarks = _normalize_landmarks_numpy
+    _offset_point_history = _offset_point_history_numpy
+
+
+def _landmark_pixels(image, landmarks) -> np.ndarray:
+    """Pixel coordinates of MediaPipe landmarks as a float64 ``(N, 2)`` array.
+
+    Values are truncated like ``int()`` and clamped to the frame, so they are
+    whole numbers stored as floats.
+    """
+    points = landmarks.landmark
+    rows = len(points)
+    image_width, image_height = image.shape[1], image.shape[0]
+    pixels = np.fromiter(
+        (value for landmark in points for value in (landmark.x, landmark.y)),
+        dtype=np.float64,
+        count=rows * 2,
+    ).reshape(rows, 2)
+    pixels *= (image_width, image_height)
+    np.trunc(pixels, out=pixels)
+    np.minimum(pixels, (image_width - 1, image_height - 1), out=pixels)
+    return pixels
+
+
+def calc_landmark_list(image, landmarks) -> np.ndarray:
+    """Return landmark pixel positions as an ``(N, 2)`` int32 array."""
+    return _landmark_pixels(image, landmarks).astype(np.int32)
+
+
+def pre_process_landmark(landmark_list: Sequence[Sequence[int]] | np.ndarray) -> np.ndarray:
+    """Translate landmarks to the wrist origin and scale into [-1, 1].
+
+    Returns a flat float32 array of ``len(landmark_list) * 2`` values.
+    """
+    rows = len(landmark_list)
+    if rows == 0:
+        return np.empty(0, dtype=np.float32)
+    coords = _landmark_buffer(rows)
+    coords[:] = landmark_list
+    _normalize_landmarks(coords)
+    return coords.reshape(-1).copy()
+
+
+def landmarks_to_features(image, landmarks) -> np.ndarray:
+    """Fused ``pre_process_landmark(calc_landmark_list(image, landmarks))``.
+
+    Reads the MediaPipe landmarks straight into an array, so no intermediate
+    list of pixel points is built.
+    """
+    rows = len(landmarks.landmark)
+    if rows == 0:
+        return np.empty(0, dtype=np.float32)
+    pixels = _landmark_pixels(image, landmarks)
+    coords = _landmark_buffer(rows)
+    coords[:] = pixels
+    _normalize_landmarks(coords)
+    return coords.reshape(-1).copy()
+
+
+def pre_process_point_history(image, point_history: Sequence[Sequence[int]]) -> np.ndarray:
+    """Translate a point trail to its first point and scale by the frame size.
+
+    Returns a flat float32 array of ``len(point_history) * 2`` values.
+    """
     image_width, image_height = image.shape[1], image.shape[0]
-    temp_point_history = copy.deepcopy(point_history)
-    base_x, base_y = 0, 0
-    for index, point in enumerate(temp_point_history):
-        if index == 0:
-            base_x, base_y = point[0], point[1]
-        temp_point_history[index][0] = (temp_point_history[index][0] - base_x) / image_width
-        temp_point_history[index][1] = (temp_point_history[index][1] - base_y) / image_height
-    return list(itertools.chain.from_iterable(temp_point_history))
+    points = np.asarray(point_history, dtype=np.float32).reshape(-1, 2)
+    if points.shape[0] == 0:
+        return np.empty(0, dtype=np.float32)
+    offsets = points - points[0]
+    offsets *= (1.0 / image_width, 1.0 / image_height)
+    return offsets.reshape(-1)
 
 
 class PointHistoryBuffer:
+    """Fixed-size ring of (x, y) points backed by a preallocated array."""
+
     def __init__(self, maxlen: int = POINT_HISTORY_LEN) -> None:
-        self._history = deque(maxlen=maxlen)
+        self._ring = np.zeros((maxlen, 2), dtype=np.int32)
+        self._window = np.empty((maxlen, 2), dtype=np.int32)
+        self._features = np.empty((maxlen, 2), dtype=np.float32)
+        self._head = 0
+        self._filled = 0
 
     def append(self, point: Sequence[int]) -> None:
-        self._history.append(list(point))
+        self._ring[self._head] = (point[0], point[1])
+        self._head = (self._head + 1) % self._ring.shape[0]
+        if self._filled < self._ring.shape[0]:
+            self._filled += 1
 
     def zeros(self) -> None:
-        self._history.append([0, 0])
+        self.append((0, 0))
+
+    def as_array(self) -> np.ndarray:
+        """Return the points oldest-first as a ``(len, 2)`` int32 array.
+
+        The result is a view into a buffer reused by the next call; copy it if
+        it needs to outlive the current frame.
+        """
+        maxlen = self._ring.shape[0]
+        if self._filled < maxlen:
+            return self._ring[: self._filled]
+        tail = maxlen - self._head
+        self._window[:tail] = self._ring[self._head :]
+        self._window[tail:] = self._ring[: self._head]
+        return self._window
+
+    def normalized(self, image) -> np.ndarray:
+        """In-place equivalent of ``pre_process_point_history(image, self.as_array())``.
+
+        The flat float32 result lives in a buffer reused by the next call, so the
+        recognizer can hand it to the classifier without allocating per frame.
+        """
+        points = self.as_array()
+        rows = points.shape[0]
+        if rows == 0:
+            return self._features[:0].reshape(-1)
+        out = self._features[:rows]
+        _offset_point_history(points, out, 1.0 / image.shape[1], 1.0 / image.shape[0])
+        return out.reshape(-1)
 
     def as_list(self) -> list[list[int]]:
-        return list(self._history)
+        return self.as_array().tolist()
 
     def __len__(self) -> int:
-        return len(self._history)
+        return self._filled
@@ -1,9 +1,29 @@
 """Thin wrapper around OpenCV VideoCapture."""
 
+import queue
+import threading
+import time
+
+from utils.log_utils import tprint
+from utils.threading_utils import run_async
+
+# How often a blocked read() re-checks whether the worker is still alive.
+_POLL_SECS = 0.1
+# How long stop() waits for an in-flight read before giving up on the worker.
+_STOP_JOIN_SECS = 1.0
+
 
 class VideoStream:
-    def __init__(self, device_index: int = 0) -> None:
+    def __init__(
+        self,
+        device_index: int = 0,
+        *,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> None:
         self.device_index = device_index
+        self.width = width
+        self.height = height
         self._cap = None
 
     def open(self) -> None:
@@ -17,6 +37,18 @@ class VideoStream:
             self._cap.release()
             self._cap = None
             raise RuntimeError(f"Unable to open camera at index {self.device_index}.")
+        self._configure(cv2)
+
+    def _configure(self, cv2) -> None:
+        # Best effort: drivers ignore properties they do not support.
+        # A one-frame driver queue keeps reads current instead of several frames
+        # stale, and MJPG avoids the costly YUYV transfer/convert on USB cameras.
+        self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        if self.width:
+            self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        if self.height:
+            self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
 
     def read(self):
         if self._cap is None:
@@ -27,3 +59,86 @@ class VideoStream:
         if self._cap is not None:
             self._cap.release()
             self._cap = None
+
+
+class FrameGrabber:
+    """Reads frames from a stream on a background thread, keeping only the newest.
+
+    Camera I/O then overlaps with whatever the caller does per frame; frames
+    the caller is too slow to consume are dropped rather than queued up.
+    """
+
+    def __init__(self, stream) -> None:
+        self.stream = stream
+        self._frames: queue.Queue = queue.Queue(maxsize=1)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = run_async(self._grab_loop, daemon=True)
+
+    def _grab_loop(self) -> None:
+        while not self._stop_event.is_set():
+            ok, frame = self.stream.read()
+            self._put_latest((ok, frame))
+            if not ok or frame is None:
+                return
+
+    def _put_latest(self, item) -> None:
+        while True:
+            try:
+                self._frames.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._frames.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def is_alive(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def read(self, timeout: float | None = None):
+        """Return the newest ``(ok, frame)``.
+
+        Waits for as long as the worker is still reading, so cameras that are
+        slow to deliver their first frame are not mistaken for failures.
+        Returns ``(False, None)`` once the worker has exited with nothing
+        queued, or after ``timeout`` seconds when one is given.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = _POLL_SECS
+            if deadline is not None:
+                wait = min(wait, max(deadline - time.monotonic(), 0.0))
+            try:
+                return self._frames.get(timeout=wait)
+            except queue.Empty:
+                pass
+            if not self.is_alive():
+                # The worker may have queued its last result just before exiting.
+                try:
+                    return self._frames.get_nowait()
+                except queue.Empty:
+                    return False, None
+            if deadline is not None and time.monotonic() >= deadline:
+                return False, None
+
+    def stop(self) -> None:
+        # Join before the caller releases the capture so no read is normally
+        # in flight. A read stalled on an unplugged camera never returns, so
+        # the wait is bounded and teardown proceeds without the worker.
+        self._stop_event.set()
+        if self._thread and threading.current_thread() is not self._thread:
+            self._thread.join(timeout=_STOP_JOIN_SECS)
+            if self._thread.is_alive():
+                tprint("[VIDEO] Camera read still blocked; releasing the capture anyway.")
+        self._thread = None
+        while True:
+            try:
+                self._frames.get_nowait()
+            except queue.Empty:
+                break
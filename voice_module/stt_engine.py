@@ -2,11 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
 import os
-import tempfile
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import AsyncIterable, Iterable
 
-from fw_transcribe.core import transcribe_file
+import numpy as np
+
+from utils.log_utils import tprint
+from voice_module.voice_utils import env_positive_int
+
+# faster-whisper consumes raw waveforms at this rate.
+WHISPER_SAMPLE_RATE = 16000
+
+# Missing or broken CUDA libraries surface as errors naming these; a decode
+# error that mentions none of them is about the input, not the device.
+_CUDA_ERROR_RE = re.compile(r"cuda|cublas|cudnn", re.IGNORECASE)
+
+
+def _detect_whisper_device() -> str:
+    """Return ``"cuda"`` when CTranslate2 can see a GPU, else ``"cpu"``."""
+    try:
+        import ctranslate2
+
+        if ctranslate2.get_cuda_device_count() > 0:
+            return "cuda"
+    except Exception:
+        # Missing package or a broken CUDA runtime both mean CPU.
+        pass
+    return "cpu"
 
 
 class SpeechToTextEngine:
@@ -15,15 +42,96 @@ class SpeechToTextEngine:
     def __init__(
         self,
         default_sample_rate: int = 16000,
+        compute_type: str | None = None,
     ) -> None:
         self.transcription_language = os.getenv("LOCAL_WHISPER_LANGUAGE", "en")
         self.default_sample_rate = default_sample_rate
         self.provider = (os.getenv("STT_PROVIDER") or "whisper-local").lower()
         self.model_path = os.getenv("LOCAL_WHISPER_MODEL_PATH", "small")
-        self.device = os.getenv("LOCAL_WHISPER_DEVICE", "cpu")
-        self.compute_type = os.getenv("LOCAL_WHISPER_COMPUTE_TYPE", "int8")
+        self._device_setting = os.getenv("LOCAL_WHISPER_DEVICE") or None
+        self._compute_type_setting = os.getenv("LOCAL_WHISPER_COMPUTE_TYPE") or compute_type
+        # Resolved on first use: detection imports CTranslate2, which sessions
+        # with voice disabled should never load.
+        self._device: str | None = None
+        self._compute_type: str | None = None
+        self._cpu_fallback = False
+        self._device_lock = threading.Lock()
         self.beam_size = int(os.getenv("LOCAL_WHISPER_BEAM_SIZE", "3"))
         self.batch_size = int(os.getenv("LOCAL_WHISPER_BATCH_SIZE", "0"))
+        self.download_root = os.getenv("LOCAL_WHISPER_DOWNLOAD_ROOT") or None
+        # 0 keeps CTranslate2's default thread count.
+        self.cpu_threads = env_positive_int("LOCAL_WHISPER_CPU_THREADS", 0)
+        # Dedicated worker: inference never waits behind (or starves) other
+        # users of the loop's default executor, and utterances run in order
+        # while the recorder keeps capturing the next one.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+
+    @property
+    def device(self) -> str:
+        return self._resolve_device()[0]
+
+    @property
+    def compute_type(self) -> str:
+        return self._resolve_device()[1]
+
+    def _resolve_device(self) -> tuple[str, str]:
+        with self._device_lock:
+            if self._device is None:
+                device = self._device_setting or _detect_whisper_device()
+                # A driver alone makes the GPU visible; without cuBLAS/cuDNN the
+                # load or first decode fails. Only an auto-selected GPU falls back.
+                self._cpu_fallback = device == "cuda" and not self._device_setting
+                # Quantized by default: int8 weights halve memory traffic; on
+                # CUDA the activations stay float16. The env var overrides the
+                # app setting.
+                self._compute_type = self._compute_type_setting or (
+                    "int8_float16" if device == "cuda" else "int8"
+                )
+                self._device = device
+            return self._device, self._compute_type
+
+    def warm_up(self) -> None:
+        """Load the Whisper model ahead of the first utterance."""
+        device, compute_type = self._resolve_device()
+        try:
+            self._load_model(device, compute_type)
+        except (RuntimeError, ValueError) as exc:
+            if not self._fall_back_to_cpu(device, exc):
+                raise
+            self._load_model(*self._resolve_device())
+
+    def _load_model(self, device: str, compute_type: str) -> None:
+        from fw_transcribe.core import get_model
+
+        get_model(
+            self.model_path,
+            device,
+            compute_type,
+            self.download_root,
+            cpu_threads=self.cpu_threads,
+        )
+
+    def _fall_back_to_cpu(self, failed_device: str, exc: Exception) -> bool:
+        """Switch an auto-selected CUDA device to CPU/int8; True if the caller should retry."""
+        with self._device_lock:
+            if failed_device != "cuda":
+                return False
+            if self._device != failed_device:
+                # Another thread already switched; retry on the new device.
+                return True
+            if not self._cpu_fallback:
+                return False
+            self._cpu_fallback = False
+            self._device = "cpu"
+            self._compute_type = "int8"
+        tprint(f"[VOICE] Whisper on CUDA failed ({exc}); falling back to CPU.")
+        return True
+
+    def _require_local_provider(self) -> None:
+        if self.provider != "whisper-local":
+            raise RuntimeError(
+                f"Unsupported STT_PROVIDER '{self.provider}'. Only 'whisper-local' is supported."
+            )
 
     def transcribe_text(self, text: str) -> str:
         """Fallback helper for simple text input (non-audio)."""
@@ -38,18 +146,12 @@ class SpeechToTextEngine:
         """Run local Whisper on an audio stream and return the transcript."""
         _ = sample_rate
         _ = timeout_seconds
-        if self.provider != "whisper-local":
-            raise RuntimeError(
-                f"Unsupported STT_PROVIDER '{self.provider}'. Only 'whisper-local' is supported."
-            )
+        self._require_local_provider()
         raise RuntimeError("Streaming transcription is not supported; use WAV bytes.")
 
     async def transcribe_audio_bytes(self, audio_bytes: bytes) -> str:
         """Run local Whisper on raw PCM16 audio bytes and return the transcript."""
-        if self.provider != "whisper-local":
-            raise RuntimeError(
-                f"Unsupported STT_PROVIDER '{self.provider}'. Only 'whisper-local' is supported."
-            )
+        self._require_local_provider()
         raise RuntimeError("PCM bytes not supported; provide WAV bytes instead.")
 
     async def transcribe_wav_bytes(self, wav_bytes: bytes) -> str:
@@ -61,43 +163,70 @@ class SpeechToTextEngine:
         Returns:
             Transcribed text
         """
-        if self.provider != "whisper-local":
-            raise RuntimeError(
-                f"Unsupported STT_PROVIDER '{self.provider}'. Only 'whisper-local' is supported."
+        self._require_local_provider()
+        return await self._run_stt(self._transcribe_wav_bytes, wav_bytes)
+
+    async def transcribe_audio_array(
+        self, audio: np.ndarray, sample_rate: int = WHISPER_SAMPLE_RATE
+    ) -> str:
+        """Run local Whisper on a mono float32 waveform in [-1, 1].
+
+        Skips the WAV encode and the decoder round trip; the waveform must
+        already be at ``WHISPER_SAMPLE_RATE``.
+        """
+        self._require_local_provider()
+        if sample_rate != WHISPER_SAMPLE_RATE:
+            raise ValueError(
+                f"Expected {WHISPER_SAMPLE_RATE} Hz audio, got {sample_rate} Hz; use WAV bytes."
             )
-        return await _to_thread(self._transcribe_wav_bytes, wav_bytes)
+        if not len(audio):
+            return ""
+        return await self._run_stt(self._transcribe_audio, np.asarray(audio, dtype=np.float32))
+
+    async def _run_stt(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
 
     def _transcribe_wav_bytes(self, wav_bytes: bytes) -> str:
         if not wav_bytes:
             return ""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp.write(wav_bytes)
-            tmp_path = tmp.name
+        # faster-whisper decodes file objects directly; no temp file round trip.
+        return self._transcribe_audio(io.BytesIO(wav_bytes))
+
+    def _transcribe_audio(self, audio) -> str:
+        # Imported on first use: faster-whisper pulls in CTranslate2, which is
+        # wasted start-up cost when voice is disabled.
+        from fw_transcribe.core import transcribe_file
+
+        device, compute_type = self._resolve_device()
         try:
-            return self._transcribe_path(tmp_path)
-        finally:
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
-
-    def _transcribe_path(self, audio_path: str) -> str:
+            return self._transcribe_with(transcribe_file, audio, device, compute_type)
+        except Exception as exc:
+            # Bad input and one-off GPU out-of-memory errors are re-raised;
+            # only a CUDA library failure moves the session to the CPU.
+            message = str(exc)
+            if (
+                not _CUDA_ERROR_RE.search(message)
+                or "out of memory" in message.lower()
+                or not self._fall_back_to_cpu(device, exc)
+            ):
+                raise
+            if hasattr(audio, "seek"):
+                audio.seek(0)
+            return self._transcribe_with(transcribe_file, audio, *self._resolve_device())
+
+    def _transcribe_with(self, transcribe_file, audio, device: str, compute_type: str) -> str:
         return transcribe_file(
-            audio_path,
+            audio,
             model_size=self.model_path,
-            device=self.device,
-            compute_type=self.compute_type,
+            device=device,
+            compute_type=compute_type,
             beam_size=self.beam_size,
             batch_size=self.batch_size,
             language=self.transcription_language,
+            download_root=self.download_root,
+            cpu_threads=self.cpu_threads,
         ).text
 
     def format_usage(self) -> str | None:
         """Local STT does not report token usage."""
         return None
-
-
-async def _to_thread(func, *args, **kwargs):
-    import asyncio
-
-    return await asyncio.to_thread(func, *args, **kwargs)
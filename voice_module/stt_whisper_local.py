@@ -2,21 +2,61 @@
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import io
+import math
 import os
+import threading
 import wave
-from typing import AsyncIterable, Iterable
+from typing import TYPE_CHECKING, AsyncIterable, Iterable
 
 import numpy as np
 
+from voice_module.voice_utils import env_positive_int
+
+# Bound once at import: pybase64 picks its SIMD kernel at runtime, and the
+# per-chunk call then skips the module attribute lookup.
+try:
+    from pybase64 import b64decode as _b64decode
+except ImportError:  # pragma: no cover - optional accelerator
+    from base64 import b64decode as _b64decode
+
+try:
+    import soxr
+except ImportError:  # pragma: no cover - optional accelerator
+    soxr = None
+
 try:
+    from scipy.signal import resample_poly
+except ImportError:  # pragma: no cover - optional accelerator
+    resample_poly = None
+
+if TYPE_CHECKING:
     from faster_whisper import WhisperModel
-except ImportError as exc:  # pragma: no cover - optional dependency
-    raise ImportError(
-        "faster-whisper is required for local whisper transcription. "
-        "Install with `pip install faster-whisper` and provide a local model path."
-    ) from exc
+
+
+# Float32 scales, so per-call multiplies do not box or promote Python floats.
+_INV_32768 = np.float32(1.0 / 32768.0)
+_INV_65536 = np.float32(1.0 / 65536.0)
+_INV_128 = np.float32(1.0 / 128.0)
+_PCM8_SIGN = np.uint8(0x80)
+
+# Samples below about -60 dBFS count as silence when trimming the edges.
+SILENCE_FLOOR = 1e-3
+# Audio kept on either side of the first/last loud sample, in seconds.
+SILENCE_PAD_SECS = 0.1
+
+# Models are shared by every engine with the same configuration; each holds
+# hundreds of MB of weights and takes seconds to load.
+_models: dict[tuple[str, str, str, int], WhisperModel] = {}
+_models_lock = threading.Lock()
+
+
+# Bounds concurrent decodes so parallel requests do not oversubscribe the CPU.
+_inference_slots = threading.BoundedSemaphore(env_positive_int("LOCAL_WHISPER_CONCURRENCY", 2))
+
+# In-process producers hand over raw PCM buffers; str chunks are base64 PCM.
+AudioChunk = bytes | bytearray | memoryview | str
 
 
 class WhisperLocalEngine:
@@ -32,45 +72,98 @@ class WhisperLocalEngine:
     ) -> None:
         self.model_path = model_path or os.getenv("LOCAL_WHISPER_MODEL_PATH", "small")
         self.device = device or os.getenv("LOCAL_WHISPER_DEVICE", "cpu")
+        # On CPU, "int8" runs CTranslate2's quantized kernels (VNNI on x86, NEON
+        # dot-product on ARM); "int8_float16" suits AVX512-FP16 hosts.
         self.compute_type = compute_type or os.getenv("LOCAL_WHISPER_COMPUTE_TYPE", "int8")
+        # 0 keeps CTranslate2's default thread count.
+        self.cpu_threads = env_positive_int("LOCAL_WHISPER_CPU_THREADS", 0)
         self.language = language or os.getenv("LOCAL_WHISPER_LANGUAGE", "en")
         self.sample_rate = sample_rate
         self._model: WhisperModel | None = None
 
     def _ensure_model(self) -> WhisperModel:
         if self._model is None:
-            self._model = WhisperModel(
-                self.model_path, device=self.device, compute_type=self.compute_type
+            self._model = _get_shared_model(
+                self.model_path, self.device, self.compute_type, self.cpu_threads
             )
         return self._model
 
+    async def warm_up(self) -> None:
+        """Load the model off the event loop so the first request skips that cost."""
+        await asyncio.to_thread(self._ensure_model)
+
     async def transcribe_stream(
-        self, audio_stream: AsyncIterable[bytes | str] | Iterable[bytes | str]
+        self, audio_stream: AsyncIterable[AudioChunk] | Iterable[AudioChunk]
     ) -> str:
-        """Collect PCM16 chunks, run local Whisper, and return text."""
-        audio_bytes = bytearray()
+        """Collect PCM16 chunks, run local Whisper, and return text.
+
+        Buffers (bytes, bytearray, memoryview) are used as-is; only str chunks
+        are base64-decoded.
+        """
+        # Collect chunks and join once: a single allocation sized to the total,
+        # instead of repeated bytearray growth plus a final bytes() copy.
+        chunks: list[bytes | bytearray | memoryview] = []
+        total = 0
         async for chunk in _to_async_iter(audio_stream):
             if not chunk:
                 continue
-            if isinstance(chunk, str):
-                audio_bytes.extend(base64.b64decode(chunk))
+            if isinstance(chunk, memoryview):
+                total += chunk.nbytes
+            elif isinstance(chunk, (bytes, bytearray)):
+                total += len(chunk)
             else:
-                audio_bytes.extend(chunk)
+                chunk = _b64decode(chunk)
+                total += len(chunk)
+            chunks.append(chunk)
 
-        if not audio_bytes:
+        if not total:
             return ""
-        return self.transcribe_audio_bytes(bytes(audio_bytes))
-
-    def transcribe_audio_bytes(self, audio_bytes: bytes) -> str:
-        """Run local Whisper on raw PCM16 bytes and return text."""
+        # A single chunk is converted straight from its buffer, with no join copy.
+        audio = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        # CTranslate2 releases the GIL, so inference in a worker thread keeps
+        # the event loop responsive.
+        return await asyncio.to_thread(self.transcribe_audio_bytes, audio)
+
+    def transcribe_audio_bytes(self, audio_bytes: bytes | bytearray | memoryview) -> str:
+        """Run local Whisper on raw PCM16 bytes (any bytes-like buffer) and return text."""
         if not audio_bytes:
             return ""
 
-        # Convert raw PCM16 bytes to float32 numpy array scaled to [-1, 1].
+        return self._transcribe_audio_array(self._pcm16_to_float(audio_bytes))
+
+    def _pcm16_to_float(self, audio_bytes: bytes | bytearray | memoryview) -> np.ndarray:
+        """Convert PCM16 bytes to float32 in [-1, 1].
+
+        The cast and scale run as one ufunc pass with no temporaries. The
+        output is allocated per call: decodes run in worker threads and may
+        overlap on one engine, so a shared buffer would be overwritten.
+        """
         audio_int16 = np.frombuffer(audio_bytes, dtype=np.int16)
-        audio_float = audio_int16.astype(np.float32) / 32768.0
+        out = np.empty(audio_int16.size, dtype=np.float32)
+        np.multiply(audio_int16, _INV_32768, out=out, casting="unsafe")
+        return out
 
-        return self._transcribe_audio_array(audio_float)
+    def _pcm16_stereo_to_mono_float(self, audio_bytes: bytes) -> np.ndarray:
+        """Downmix interleaved PCM16 stereo to mono float32.
+
+        Channels are summed widened to int32 and scaled by 1/65536, which folds
+        the mean and the PCM16 normalization into a single multiply.
+        """
+        frames = np.frombuffer(audio_bytes, dtype=np.int16)
+        frames = frames[: frames.size - frames.size % 2].reshape(-1, 2)
+        summed = np.add(frames[:, 0], frames[:, 1], dtype=np.int32)
+        return np.multiply(summed, _INV_65536, dtype=np.float32)
+
+    def _pcm8_to_float(self, audio_bytes: bytes) -> np.ndarray:
+        """Convert unsigned PCM8 bytes to float32 in [-1, 1].
+
+        Flipping the sign bit turns offset-binary PCM8 into two's complement,
+        so the bias is removed at one byte per sample and a single
+        multiply widens and scales.
+        """
+        audio_uint8 = np.frombuffer(audio_bytes, dtype=np.uint8)
+        signed = np.bitwise_xor(audio_uint8, _PCM8_SIGN)
+        return np.multiply(signed.view(np.int8), _INV_128, dtype=np.float32)
 
     def transcribe_wav_bytes(self, wav_bytes: bytes) -> str:
         """Run local Whisper on WAV-formatted bytes and return text.
@@ -101,16 +194,17 @@ class WhisperLocalEngine:
                 raw_audio = wav_file.readframes(n_frames)
 
             # Convert to float32 array
-            if sample_width == 2:  # 16-bit
-                audio_int16 = np.frombuffer(raw_audio, dtype=np.int16)
-                audio_float = audio_int16.astype(np.float32) / 32768.0
+            if sample_width == 2 and n_channels == 2:
+                # Fused downmix + normalization; already mono afterwards.
+                audio_float = self._pcm16_stereo_to_mono_float(raw_audio)
+                n_channels = 1
+            elif sample_width == 2:  # 16-bit
+                audio_float = self._pcm16_to_float(raw_audio)
             elif sample_width == 1:  # 8-bit
-                audio_int8 = np.frombuffer(raw_audio, dtype=np.uint8)
-                audio_float = (audio_int8.astype(np.float32) - 128) / 128.0
+                audio_float = self._pcm8_to_float(raw_audio)
             else:
                 # Assume 16-bit for other cases
-                audio_int16 = np.frombuffer(raw_audio, dtype=np.int16)
-                audio_float = audio_int16.astype(np.float32) / 32768.0
+                audio_float = self._pcm16_to_float(raw_audio)
 
             # Convert stereo to mono if needed
             if n_channels == 2:
@@ -128,27 +222,53 @@ class WhisperLocalEngine:
 
     def _transcribe_audio_array(self, audio_float: np.ndarray) -> str:
         """Transcribe a float32 audio array using Whisper."""
+        audio_float = self._trim_silence(audio_float)
         if len(audio_float) == 0:
             return ""
 
         model = self._ensure_model()
-        segments, _info = model.transcribe(
-            audio=audio_float,
-            language=self.language,
-            beam_size=3,
-            vad_filter=True,
-        )
-        parts: list[str] = []
-        for seg in segments:
-            if seg.text:
-                parts.append(seg.text.strip())
+        # Segments decode lazily, so the slot is held until they are consumed.
+        with _inference_slots:
+            segments, _info = model.transcribe(
+                audio=audio_float,
+                language=self.language,
+                beam_size=3,
+                vad_filter=True,
+            )
+            parts: list[str] = []
+            for seg in segments:
+                if seg.text:
+                    parts.append(seg.text.strip())
         return " ".join(parts).strip()
 
+    def _trim_silence(self, audio: np.ndarray) -> np.ndarray:
+        """Drop leading/trailing silence so the encoder never sees it.
+
+        Recordings carry pre-roll and a silence tail; cutting them here skips
+        the model (and its load) for silent input and shortens the rest.
+        Interior pauses are still left to faster-whisper's ``vad_filter``.
+        """
+        loud = np.flatnonzero(np.abs(audio) > SILENCE_FLOOR)
+        if loud.size == 0:
+            return audio[:0]
+        pad = int(self.sample_rate * SILENCE_PAD_SECS)
+        return audio[max(int(loud[0]) - pad, 0) : int(loud[-1]) + 1 + pad]
+
     def _resample(self, audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
-        """Simple resampling using linear interpolation."""
+        """Resample with a polyphase filter (soxr or SciPy), else linear interpolation."""
         if orig_sr == target_sr:
             return audio
 
+        if soxr is not None:
+            return soxr.resample(audio, orig_sr, target_sr, quality="QQ").astype(
+                np.float32, copy=False
+            )
+        if resample_poly is not None:
+            divisor = math.gcd(orig_sr, target_sr)
+            return resample_poly(audio, target_sr // divisor, orig_sr // divisor).astype(
+                np.float32, copy=False
+            )
+
         duration = len(audio) / orig_sr
         target_length = int(duration * target_sr)
 
@@ -161,10 +281,49 @@ class WhisperLocalEngine:
         return resampled.astype(np.float32)
 
 
-async def _to_async_iter(stream: AsyncIterable[bytes | str] | Iterable[bytes | str]):
+def _get_shared_model(
+    model_path: str, device: str, compute_type: str, cpu_threads: int
+) -> WhisperModel:
+    key = (model_path, device, compute_type, cpu_threads)
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            # One worker: each engine transcribes a single stream, so all
+            # threads go to intra-op parallelism.
+            model = _import_whisper_model()(
+                model_path,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=1,
+            )
+            _models[key] = model
+    return model
+
+
+def _import_whisper_model():
+    # Imported on first use: CTranslate2 is heavy, and processes that never
+    # transcribe should not pay for loading it.
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError(
+            "faster-whisper is required for local whisper transcription. "
+            "Install with `pip install faster-whisper` and provide a local model path."
+        ) from exc
+    return WhisperModel
+
+
+def _to_async_iter(
+    stream: AsyncIterable[AudioChunk] | Iterable[AudioChunk],
+) -> AsyncIterable[AudioChunk]:
+    # Async sources are returned as-is rather than re-yielded through an
+    # extra generator frame per chunk.
     if hasattr(stream, "__aiter__"):
-        async for item in stream:  # type: ignore[operator]
-            yield item
-    else:
-        for item in stream:
-            yield item
+        return stream  # type: ignore[return-value]
+    return _iter_sync(stream)  # type: ignore[arg-type]
+
+
+async def _iter_sync(stream: Iterable[AudioChunk]):
+    for item in stream:
+        yield item
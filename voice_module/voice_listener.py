@@ -4,18 +4,35 @@ WAV-based pipeline: records to in-memory WAV, detects silence, normalizes audio,
 then transcribes locally using faster-whisper.
 """
 import asyncio
-import audioop
 import io
+import math
+import struct
 import threading
 import time
-import wave
+from collections import deque
 from typing import Callable, Optional
 
+import numpy as np
+
 from command_controller.controller import CommandController
 from utils.log_utils import tprint
 from utils.file_utils import load_json
 from utils.settings_store import get_settings, is_deep_logging
-from voice_module.stt_engine import SpeechToTextEngine
+from utils.threading_utils import run_async
+from voice_module.stt_engine import WHISPER_SAMPLE_RATE, SpeechToTextEngine
+
+
+# Audio kept around the first/last voiced frame when trimming, in seconds.
+TRIM_PAD_SECS = 0.2
+
+# UI meters gain nothing past ~30 Hz; extra level callbacks are dropped.
+LEVEL_EMIT_INTERVAL_SECS = 1 / 30
+
+# Recorded segments waiting for Whisper; newer ones are dropped beyond this.
+MAX_PENDING_SEGMENTS = 2
+
+# Canonical 44-byte RIFF/WAVE header for PCM data.
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
 
 
 class VoiceListener:
@@ -46,6 +63,7 @@ class VoiceListener:
         noise_gate_enabled: bool = True,
         noise_gate_threshold: float = 0.01,
         noise_gate_attenuation: float = 0.2,
+        whisper_compute_type: str | None = None,
         # Legacy compatibility parameters (mapped to new ones)
         pause_threshold_secs: float | None = None,
         live_transcribe_interval_secs: float | None = None,
@@ -54,7 +72,7 @@ class VoiceListener:
         partial_window_secs: float | None = None,
     ) -> None:
         self.controller = controller
-        self.stt = SpeechToTextEngine()
+        self.stt = SpeechToTextEngine(compute_type=whisper_compute_type)
         self.listen_seconds = listen_seconds
         self.chunk_size = chunk_size
         self.single_batch = single_batch
@@ -84,43 +102,86 @@ class VoiceListener:
         self.min_record_duration_secs = max(0.1, self.min_record_duration_secs)
 
         self._thread: threading.Thread | None = None
+        self._task: asyncio.Task | None = None
         self._stop_event = threading.Event()
         self._single_batch_done = False
         self._transcribing = False
         self._last_record_end_time: float | None = None
+        # Microphone kept open across utterances in continuous mode.
+        self._pa = None
+        self._stream = None
+        self._chunks: asyncio.Queue[bytes] | None = None
+        self._input_sample_rate = 0
+        # Settings lookup cached until the next start(), not read per utterance.
+        self._mic_index: int | None = None
+        self._mic_index_resolved = False
         self._log_debug = False
         self._refresh_log_flags()
 
     def start(self) -> None:
         """Begin microphone capture in a background thread."""
-        if self._thread and self._thread.is_alive():
+        if self.is_running():
             tprint("[VOICE] Listener already running")
             return
-        self._refresh_log_flags()
-        self._stop_event.clear()
-        self._single_batch_done = False
+        self._prepare_run()
 
         def _runner() -> None:
             try:
-                if self.single_batch:
-                    asyncio.run(self._record_and_transcribe_once())
-                else:
-                    asyncio.run(self._continuous_wav_loop())
-            except Exception as exc:  # pragma: no cover - surface runtime issues
-                tprint(f"[VOICE] Listener error: {exc}")
-                if self.on_error:
-                    self.on_error(str(exc))
+                asyncio.run(self._run())
             finally:
-                self._single_batch_done = True
-                self._stop_event.set()
                 self._thread = None
 
-        tprint("[VOICE] Listener starting (WAV pipeline -> local Whisper)...")
         self._thread = threading.Thread(
             target=_runner, name="VoiceListenerWAV", daemon=False
         )
         self._thread.start()
 
+    async def run_forever(self) -> None:
+        """Run the listener on the caller's event loop until stop() is called.
+
+        Alternative to start() for hosts that already run asyncio: schedule it
+        with ``asyncio.create_task(listener.run_forever())`` instead of having
+        the listener spin up its own thread and loop.
+        """
+        if self.is_running():
+            tprint("[VOICE] Listener already running")
+            return
+        self._prepare_run()
+        self._task = asyncio.current_task()
+        try:
+            await self._run()
+        finally:
+            self._task = None
+
+    def _prepare_run(self) -> None:
+        self._refresh_log_flags()
+        self._mic_index_resolved = False
+        self._stop_event.clear()
+        self._single_batch_done = False
+        tprint("[VOICE] Listener starting (WAV pipeline -> local Whisper)...")
+        # Load the model while the microphone warms up, not on the first utterance.
+        run_async(self._warm_up_stt)
+
+    async def _run(self) -> None:
+        try:
+            if self.single_batch:
+                await self._record_and_transcribe_once()
+            else:
+                await self._continuous_wav_loop()
+        except Exception as exc:  # pragma: no cover - surface runtime issues
+            tprint(f"[VOICE] Listener error: {exc}")
+            if self.on_error:
+                self.on_error(str(exc))
+        finally:
+            self._single_batch_done = True
+            self._stop_event.set()
+
+    def _warm_up_stt(self) -> None:
+        try:
+            self.stt.warm_up()
+        except Exception as exc:
+            tprint(f"[VOICE] Whisper warm-up failed: {exc}")
+
     def stop(self) -> None:
         """Signal the listener to stop after the current recording."""
         self._stop_event.set()
@@ -131,15 +192,24 @@ class VoiceListener:
     def is_running(self) -> bool:
         if self.single_batch and self._single_batch_done:
             return False
+        if self._task is not None:
+            return not self._task.done()
         return bool(self._thread and self._thread.is_alive())
 
     async def _continuous_wav_loop(self) -> None:
         """Continuously record WAV segments, detect silence, and transcribe."""
-        queue: asyncio.Queue[tuple[bytes, int, float] | None] = asyncio.Queue(maxsize=2)
-        worker = asyncio.create_task(self._transcribe_worker(queue))
+        # Single producer, single consumer on one loop: a deque plus an event
+        # is all the handoff needs, without Queue's waiter bookkeeping.
+        pending: deque[tuple[bytes, int, float] | None] = deque()
+        ready = asyncio.Event()
+        worker = asyncio.create_task(self._transcribe_worker(pending, ready))
         try:
             while not self._stop_event.is_set():
                 try:
+                    # Opened once and reused: device open/close costs 100 ms+
+                    # on some hosts and would otherwise be paid per utterance.
+                    if self._stream is None:
+                        self._open_input()
                     audio_data, sample_rate, duration = await self._record_with_silence_detection()
                     if self._stop_event.is_set():
                         break
@@ -147,18 +217,23 @@ class VoiceListener:
                         if self._log_debug and duration > 0:
                             tprint(f"[VOICE] Recording too short ({duration:.2f}s), skipping")
                         continue
-                    try:
-                        queue.put_nowait((audio_data, sample_rate, duration))
-                    except asyncio.QueueFull:
+                    if len(pending) >= MAX_PENDING_SEGMENTS:
                         if self._log_debug:
                             tprint("[VOICE] Transcription backlog; dropping segment")
+                        continue
+                    pending.append((audio_data, sample_rate, duration))
+                    ready.set()
                 except Exception as exc:
                     if self.on_error:
                         self.on_error(str(exc))
                     tprint(f"[VOICE] Recording error: {exc}")
+                    # Reopen the device on the next attempt.
+                    self._close_input()
                     await asyncio.sleep(0.2)
         finally:
-            await queue.put(None)
+            self._close_input()
+            pending.append(None)
+            ready.set()
             await worker
 
     async def _record_and_transcribe_once(self) -> None:
@@ -179,133 +254,219 @@ class VoiceListener:
 
         await self._transcribe_segment(audio_data, sample_rate)
 
-    async def _record_with_silence_detection(self) -> tuple[bytes, int, float]:
+    async def _record_with_silence_detection(self) -> tuple[bytes | bytearray, int, float]:
         """Record microphone audio until silence is detected.
 
+        Uses the microphone already opened by the continuous loop, or opens
+        one just for this recording.
+
         Returns:
             Tuple of (audio_bytes, sample_rate, duration_seconds)
         """
+        owns_input = self._stream is None
+        if owns_input:
+            self._open_input()
+        try:
+            return await self._record_from_input()
+        finally:
+            if owns_input:
+                self._close_input()
+
+    def _open_input(self) -> None:
+        """Open the microphone stream; must be called from the event loop thread."""
         import pyaudio
 
-        pa = pyaudio.PyAudio()
         sample_rate = self.stt.default_sample_rate
-        input_device_index = self._resolve_microphone_device_index()
-
-        stream = pa.open(
-            format=pyaudio.paInt16,
-            channels=1,
-            rate=sample_rate,
-            input=True,
-            frames_per_buffer=self.chunk_size,
-            input_device_index=input_device_index,
-        )
+        input_device_index = self._microphone_index()
 
-        audio_chunks: list[bytes] = []
-        pre_roll: list[bytes] = []
-        recording_started = False
-        recording_start_time: float | None = None
-        last_voice_time: float | None = None
-        voice_active_start: float | None = None
-        bytes_per_sample = 2  # 16-bit audio
-        pre_roll_frames = max(0, int((self.pre_roll_secs * sample_rate) / self.chunk_size))
-        frame_bytes = int(sample_rate * 0.01) * bytes_per_sample
+        # Callback mode: PortAudio's thread hands each chunk straight to the
+        # event loop, instead of a worker-thread hop per blocking read.
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue[bytes] = asyncio.Queue()
 
+        def _on_audio(in_data, _frame_count, _time_info, _status):
+            try:
+                loop.call_soon_threadsafe(chunks.put_nowait, in_data)
+            except RuntimeError:
+                # Event loop already closed during shutdown.
+                return None, pyaudio.paAbort
+            return None, pyaudio.paContinue
+
+        pa = pyaudio.PyAudio()
         try:
-            if self._last_record_end_time:
-                gap = time.monotonic() - self._last_record_end_time
-                if gap < self.min_gap_secs:
-                    await asyncio.sleep(self.min_gap_secs - gap)
+            stream = pa.open(
+                format=pyaudio.paInt16,
+                channels=1,
+                rate=sample_rate,
+                input=True,
+                frames_per_buffer=self.chunk_size,
+                input_device_index=input_device_index,
+                stream_callback=_on_audio,
+            )
+        except Exception:
+            pa.terminate()
+            raise
+        self._pa = pa
+        self._stream = stream
+        self._chunks = chunks
+        self._input_sample_rate = sample_rate
+        self._specialize_for_rate(sample_rate)
+
+    def _close_input(self) -> None:
+        stream, pa = self._stream, self._pa
+        self._stream = self._pa = self._chunks = None
+        if stream is not None:
+            try:
+                stream.stop_stream()
+                stream.close()
+            except Exception as exc:  # pragma: no cover - driver teardown errors
+                tprint(f"[VOICE] Microphone close failed: {exc}")
+        if pa is not None:
+            pa.terminate()
 
-            while not self._stop_event.is_set():
-                data = await asyncio.to_thread(
-                    stream.read, self.chunk_size, exception_on_overflow=False
-                )
-                if not data:
-                    continue
-
-                # Compute audio level
-                level = self._compute_audio_level(data)
-                if self.on_audio_level:
-                    self.on_audio_level(level)
-
-                if self.noise_gate_enabled:
-                    cleaned = self._apply_noise_gate(data, level)
-                else:
-                    cleaned = data
-
-                now = time.monotonic()
-
-                # Detect voice activity with a short debounce
-                if level >= self.silence_threshold:
-                    last_voice_time = now
-                    if voice_active_start is None:
-                        voice_active_start = now
-                    if not recording_started and (now - voice_active_start) >= self.min_voice_duration_secs:
-                        recording_started = True
-                        recording_start_time = now
-                        if pre_roll:
-                            audio_chunks.extend(pre_roll)
-                            pre_roll.clear()
-                        if self.on_state:
-                            self.on_state("recording")
-                        if self._log_debug:
-                            tprint("[VOICE] Voice detected, recording started")
-                else:
-                    voice_active_start = None
-
-                # Only buffer audio once recording has started
-                if recording_started:
-                    audio_chunks.append(cleaned or data)
-
-                    # Check for silence timeout
-                    if last_voice_time is not None:
-                        silence_elapsed = now - last_voice_time
-                        if silence_elapsed >= self.silence_duration_secs:
-                            if self._log_debug:
-                                tprint(f"[VOICE] Silence detected ({silence_elapsed:.2f}s)")
-                            break
-                    # Enforce maximum record duration to avoid long stalls
-                    if recording_start_time is not None:
-                        elapsed = now - recording_start_time
-                        if elapsed >= self.max_record_duration_secs:
-                            if self._log_debug:
-                                tprint(f"[VOICE] Max record duration reached ({elapsed:.2f}s)")
-                            break
-
-                if not recording_started and pre_roll_frames > 0:
-                    pre_roll.append(cleaned or data)
-                    if len(pre_roll) > pre_roll_frames:
-                        pre_roll.pop(0)
+    def _specialize_for_rate(self, sample_rate: int) -> None:
+        """Convert the timing settings to chunk counts for ``sample_rate``.
 
-        finally:
-            stream.stop_stream()
-            stream.close()
-            pa.terminate()
+        The record loop then counts chunks instead of reading the clock: each
+        chunk is ``chunk_size`` frames of audio, so chunk counts are audio time.
+        """
+        chunks_per_sec = sample_rate / self.chunk_size
+
+        def _chunks(secs: float) -> int:
+            # Round up like the old "elapsed >= limit" comparisons; the epsilon
+            # keeps exact multiples (e.g. 0.5 s of 0.1 s chunks) from rounding over.
+            return max(0, math.ceil(secs * chunks_per_sec - 1e-9))
+
+        self._chunk_bytes = self.chunk_size * 2  # 16-bit audio
+        self._pre_roll_frames = int(self.pre_roll_secs * chunks_per_sec)
+        self._min_voice_frames = _chunks(self.min_voice_duration_secs)
+        self._silence_frames_needed = _chunks(self.silence_duration_secs)
+        self._max_frames = _chunks(self.max_record_duration_secs)
+        self._level_every = max(1, _chunks(LEVEL_EMIT_INTERVAL_SECS))
+
+    async def _record_from_input(self) -> tuple[bytes | bytearray, int, float]:
+        chunks = self._chunks
+        sample_rate = self._input_sample_rate
+        pre_roll_frames = self._pre_roll_frames
+        min_voice_frames = self._min_voice_frames
+        silence_frames_needed = self._silence_frames_needed
+        max_frames = self._max_frames
 
+        recording_started = False
+        voiced_frames = 0  # consecutive voiced chunks before recording starts
+        silent_frames = 0  # chunks since the last voiced one
+        recorded_frames = 0  # chunks since recording started
+        level_countdown = 0
+        # Bounded: the oldest chunk falls off in O(1) while idling.
+        pre_roll: deque[bytes] | None = deque(maxlen=pre_roll_frames) if pre_roll_frames else None
+        # Fixed-size buffer sized for pre-roll plus the longest recording, so a
+        # backlog of queued chunks (e.g. after a stall) cannot grow it past
+        # max_record_duration_secs; nothing is reallocated while recording.
+        capacity = (pre_roll_frames + max_frames + 1) * self._chunk_bytes
+        audio_buffer = bytearray(capacity)
+        buffer_view = memoryview(audio_buffer)
+        written = 0
+        # Thresholds as per-sample energy (sum of squares / n), fixed for this
+        # recording, so chunks are compared without a sqrt or divide.
+        silence_energy = (self.silence_threshold * 32768.0) ** 2
+        gate_energy = (self.noise_gate_threshold * 32768.0) ** 2
+
+        if self._last_record_end_time:
+            gap = time.monotonic() - self._last_record_end_time
+            if gap < self.min_gap_secs:
+                await asyncio.sleep(self.min_gap_secs - gap)
+                # Audio captured during the gap is discarded, as before.
+                while not chunks.empty():
+                    chunks.get_nowait()
+
+        while not self._stop_event.is_set():
+            data = await chunks.get()
+            samples = _pcm_view(data)
+            if not samples.size:
+                continue
+
+            energy = _sum_of_squares(samples)
+            voiced = energy >= silence_energy * samples.size
+            level_countdown -= 1
+            if self.on_audio_level and (
+                level_countdown <= 0
+                # Always report the chunk that starts a recording.
+                or (voiced and not recording_started)
+            ):
+                level_countdown = self._level_every
+                self.on_audio_level(_energy_to_level(energy, samples.size))
+
+            if self.noise_gate_enabled and energy < gate_energy * samples.size:
+                cleaned = _scale_pcm16(samples, self.noise_gate_attenuation)
+            else:
+                cleaned = data
+
+            # Detect voice activity with a short debounce
+            if voiced:
+                silent_frames = 0
+                voiced_frames += 1
+                if not recording_started and voiced_frames > min_voice_frames:
+                    recording_started = True
+                    if pre_roll:
+                        for buffered in pre_roll:
+                            end = min(written + len(buffered), capacity)
+                            buffer_view[written:end] = buffered[: end - written]
+                            written = end
+                        pre_roll.clear()
+                    if self.on_state:
+                        self.on_state("recording")
+                    if self._log_debug:
+                        tprint("[VOICE] Voice detected, recording started")
+            else:
+                voiced_frames = 0
+                silent_frames += 1
+
+            # Only buffer audio once recording has started
+            if recording_started:
+                chunk = cleaned or data
+                end = min(written + len(chunk), capacity)
+                buffer_view[written:end] = chunk[: end - written]
+                written = end
+                if written >= capacity:
+                    if self._log_debug:
+                        tprint("[VOICE] Record buffer full, stopping")
+                    break
+
+                # Check for silence timeout
+                if silent_frames >= silence_frames_needed:
+                    if self._log_debug:
+                        tprint(f"[VOICE] Silence detected ({silent_frames} chunks)")
+                    break
+                # Enforce maximum record duration to avoid long stalls
+                if recorded_frames >= max_frames:
+                    if self._log_debug:
+                        tprint(f"[VOICE] Max record duration reached ({recorded_frames} chunks)")
+                    break
+                recorded_frames += 1
+
+            if not recording_started and pre_roll is not None:
+                pre_roll.append(cleaned or data)
+
+        buffer_view.release()
         # Calculate duration
-        if not audio_chunks or not recording_start_time:
+        if not written or not recording_started:
             return b"", sample_rate, 0.0
 
-        audio_bytes = b"".join(audio_chunks)
-        duration = len(audio_bytes) / (sample_rate * bytes_per_sample)
+        # Shrinks in place; no copy of the recorded audio.
+        del audio_buffer[written:]
+        duration = written / (sample_rate * 2)
         self._last_record_end_time = time.monotonic()
-        return audio_bytes, sample_rate, duration
-
-    def _apply_noise_gate(self, pcm_bytes: bytes, level: float) -> bytes:
-        if not pcm_bytes:
-            return pcm_bytes
-        if level >= self.noise_gate_threshold:
-            return pcm_bytes
-        try:
-            return audioop.mul(pcm_bytes, 2, self.noise_gate_attenuation)
-        except audioop.error:
-            return pcm_bytes
+        return audio_buffer, sample_rate, duration
 
     async def _transcribe_worker(
-        self, queue: asyncio.Queue[tuple[bytes, int, float] | None]
+        self, pending: deque[tuple[bytes, int, float] | None], ready: asyncio.Event
     ) -> None:
         while True:
-            item = await queue.get()
+            if not pending:
+                ready.clear()
+                await ready.wait()
+                continue
+            item = pending.popleft()
             if item is None:
                 return
             audio_data, sample_rate, _duration = item
@@ -318,40 +479,43 @@ class VoiceListener:
         if self.on_state:
             self.on_state("transcribing")
 
-        normalized_audio = self._normalize_audio(audio_data)
-        wav_buffer = self._create_wav_buffer(normalized_audio, sample_rate)
+        audio_data = self._trim_silence(audio_data, sample_rate)
 
         self._transcribing = True
         try:
-            text = await self.stt.transcribe_wav_bytes(wav_buffer.getvalue())
+            if sample_rate == WHISPER_SAMPLE_RATE:
+                # Hand Whisper the waveform directly; no WAV encode/decode.
+                waveform = self._normalize_waveform(_pcm16_to_float32(audio_data))
+                text = await self.stt.transcribe_audio_array(waveform, sample_rate)
+            else:
+                normalized_audio = self._normalize_audio(audio_data)
+                wav_buffer = self._create_wav_buffer(normalized_audio, sample_rate)
+                text = await self.stt.transcribe_wav_bytes(wav_buffer.getvalue())
             text = text.strip()
 
-            if self._log_debug:
-                tprint(f"[VOICE] Transcript: {text!r}")
-
             if text:
-                tprint(f"[VOICE] Transcript: {text}")
-                if self.log_token_usage:
-                    usage = self.stt.format_usage()
-                    if usage:
-                        tprint(f"[VOICE] Token usage: {usage}")
+                # Dispatch before logging so the controller worker starts on
+                # the command while the console write happens.
                 if self.on_final_transcript:
                     self.on_final_transcript(text)
                 if self.send_to_executor:
                     self.controller.handle_event(source="voice", action=text)
+
+            if text or self._log_debug:
+                # One line per transcript: repr in debug mode, plus usage if asked.
+                shown = repr(text) if self._log_debug else text
+                message = f"[VOICE] Transcript: {shown}"
+                if text and self.log_token_usage:
+                    usage = self.stt.format_usage()
+                    if usage:
+                        message += f" | Token usage: {usage}"
+                tprint(message)
         finally:
             self._transcribing = False
 
         if self.on_state:
             self.on_state("listening")
 
-    def _compute_audio_level(self, pcm_bytes: bytes) -> float:
-        """Compute normalized audio level from PCM16 bytes."""
-        if not pcm_bytes:
-            return 0.0
-        rms = audioop.rms(pcm_bytes, 2)
-        return min(1.0, rms / 32768.0)
-
     def _normalize_audio(self, audio_bytes: bytes, target_level: float = 0.8) -> bytes:
         """Normalize audio amplitude to target level.
 
@@ -362,11 +526,12 @@ class VoiceListener:
         Returns:
             Normalized PCM16 audio bytes
         """
-        if not audio_bytes:
+        samples = _pcm_view(audio_bytes)
+        if not samples.size:
             return audio_bytes
 
-        # Get current max amplitude
-        max_amp = audioop.max(audio_bytes, 2)
+        # Get current max amplitude (widened so -32768 does not overflow)
+        max_amp = max(int(samples.max()), -int(samples.min()))
         if max_amp == 0:
             return audio_bytes
 
@@ -382,24 +547,68 @@ class VoiceListener:
             # Audio is already loud enough
             return audio_bytes
 
-        # Apply gain using audioop.mul
-        try:
-            normalized = audioop.mul(audio_bytes, 2, gain_factor)
-            return normalized
-        except audioop.error:
+        return _scale_pcm16(samples, gain_factor)
+
+    def _trim_silence(self, audio_bytes: bytes, sample_rate: int) -> bytes | memoryview:
+        """Cut leading/trailing silence (pre-roll and the silence tail) before STT.
+
+        Frames of 20 ms whose RMS reaches ``silence_threshold`` count as voiced;
+        ``TRIM_PAD_SECS`` is kept on either side for soft onsets and tails.
+        Returns a zero-copy view, or the input unchanged if nothing is cut.
+        """
+        samples = _pcm_view(audio_bytes)
+        frame = max(1, sample_rate // 50)
+        n_frames = samples.size // frame
+        if n_frames == 0:
+            return audio_bytes
+        frames = samples[: n_frames * frame].reshape(n_frames, frame).astype(np.float32)
+        rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame)
+        voiced = np.flatnonzero(rms >= self.silence_threshold * 32768.0)
+        if not voiced.size:
             return audio_bytes
+        pad = int(sample_rate * TRIM_PAD_SECS)
+        start = max(int(voiced[0]) * frame - pad, 0)
+        end = min((int(voiced[-1]) + 1) * frame + pad, samples.size)
+        if start == 0 and end == samples.size:
+            return audio_bytes
+        return memoryview(audio_bytes)[start * 2 : end * 2]
+
+    def _normalize_waveform(self, samples: np.ndarray, target_level: float = 0.8) -> np.ndarray:
+        """Float32 counterpart of ``_normalize_audio``, scaling ``samples`` in place.
+
+        Applies the same capped gain as one multiply on the converted
+        waveform, so no extra int16 peak/scale passes or saturation are needed.
+        """
+        if not samples.size:
+            return samples
+        peak = float(np.abs(samples).max())
+        if peak == 0.0:
+            return samples
+        gain_factor = min(target_level * (32767 / 32768) / peak, 10.0)
+        if gain_factor > 1.0:
+            samples *= np.float32(gain_factor)
+        return samples
 
     def _create_wav_buffer(self, audio_bytes: bytes, sample_rate: int) -> io.BytesIO:
-        """Create an in-memory WAV file from PCM16 audio bytes."""
+        """Create an in-memory WAV file from mono PCM16 audio bytes."""
+        data_len = len(audio_bytes)
+        header = _WAV_HEADER.pack(
+            b"RIFF", 36 + data_len, b"WAVE",
+            b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+            b"data", data_len,
+        )
         wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_bytes)
+        wav_buffer.write(header)
+        wav_buffer.write(audio_bytes)
         wav_buffer.seek(0)
         return wav_buffer
 
+    def _microphone_index(self) -> int | None:
+        if not self._mic_index_resolved:
+            self._mic_index = self._resolve_microphone_device_index()
+            self._mic_index_resolved = True
+        return self._mic_index
+
     def _resolve_microphone_device_index(self) -> int | None:
         """Get configured microphone device index from settings."""
         settings = load_json("config/app_settings.json")
@@ -418,3 +627,31 @@ class VoiceListener:
         except Exception:
             settings = {}
         self._log_debug = bool(settings.get("log_command_debug")) or is_deep_logging()
+
+
+def _pcm_view(pcm_bytes: bytes) -> np.ndarray:
+    """Return a zero-copy int16 view over PCM16 bytes (a trailing odd byte is ignored)."""
+    return np.frombuffer(pcm_bytes, dtype=np.int16, count=len(pcm_bytes) // 2)
+
+
+def _sum_of_squares(samples: np.ndarray) -> int:
+    """Exact sum of squared PCM16 samples (int64 dot, one SIMD pass)."""
+    wide = samples.astype(np.int64)
+    return int(wide.dot(wide))
+
+
+def _energy_to_level(energy: int, count: int) -> float:
+    """Map a chunk's sum of squares to its RMS level in [0, 1]."""
+    return min(1.0, math.sqrt(energy / count) / 32768.0)
+
+
+def _pcm16_to_float32(pcm_bytes: bytes) -> np.ndarray:
+    """Convert PCM16 bytes to a float32 waveform in [-1, 1] in one pass."""
+    return np.multiply(_pcm_view(pcm_bytes), np.float32(1.0 / 32768.0), dtype=np.float32)
+
+
+def _scale_pcm16(samples: np.ndarray, factor: float) -> bytes:
+    """Multiply PCM16 samples by ``factor``, saturating at the int16 range."""
+    scaled = samples * np.float32(factor)
+    np.clip(scaled, -32768, 32767, out=scaled)
+    return scaled.astype(np.int16).tobytes()
@@ -1,8 +1,25 @@
 """Utility helpers for voice processing."""
 
-import re
+import os
 
 
 def normalize_phrase(phrase: str) -> str:
     """Normalize spoken text for easier matching."""
-    return re.sub(r"\s+", " ", phrase.strip().lower())
+    # str.split() drops leading/trailing whitespace and splits on the same
+    # characters as the regex \s, so one C-level pass replaces strip + sub.
+    return " ".join(phrase.lower().split())
+
+
+def env_positive_int(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment.
+
+    Unset or unparsable values give ``default``; values below 1 are clamped to 1.
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        return default
+    return max(value, 1)